@@ -1,14 +1,18 @@
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from manga_scraper.config import settings
-from manga_scraper.core.database import init_db
+from manga_scraper.core.database import AsyncSessionLocal, init_db
 from manga_scraper.core.logging import setup_logging
 from manga_scraper.core.redis import get_redis
-from manga_scraper.storage import ImageStorage
+from manga_scraper.storage import close_storage, get_storage
+
+# CORS is only enabled in debug; production serves no cross-origin browsers
+CORS_ALLOW_ORIGINS = ("*",)
 
 
 @asynccontextmanager
@@ -19,14 +23,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_db()
     
     # Ensure S3 bucket exists
-    storage = ImageStorage()
-    await storage.ensure_bucket_exists()
+    await get_storage().ensure_bucket_exists()
     
     yield
     
     # Shutdown
     redis = get_redis()
     await redis.close()
+    await close_storage()
 
 
 def create_app() -> FastAPI:
@@ -41,13 +45,33 @@ def create_app() -> FastAPI:
     )
 
     # CORS
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if settings.debug else [],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if settings.debug:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=CORS_ALLOW_ORIGINS,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # One database session per request, exposed to routes via get_db
+    @app.middleware("http")
+    async def db_session_middleware(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        async with AsyncSessionLocal() as session:
+            request.state.db = session
+            try:
+                response = await call_next(request)
+            except Exception:
+                await session.rollback()
+                raise
+
+            if response.status_code < 400:
+                await session.commit()
+            else:
+                await session.rollback()
+            return response
 
     # Include routers
     from manga_scraper.api.routes import health, series, chapters, jobs
@@ -0,0 +1,65 @@
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from manga_scraper.core.logging import get_logger
+from manga_scraper.core.redis import get_redis
+
+logger = get_logger("api.cache")
+
+
+def _cache_key(prefix: str, kwargs: dict[str, Any]) -> str:
+    parts = [str(v) for v in kwargs.values() if not isinstance(v, AsyncSession)]
+    return ":".join([prefix, *parts])
+
+
+def cached(prefix: str, ttl: int = 300) -> Callable[..., Any]:
+    """
+    Cache-aside decorator for GET endpoints.
+
+    The key is built from the prefix and the endpoint's parameters (the
+    database session is skipped), e.g. ``series:42``. Responses are stored as
+    JSON and returned as-is on a hit; FastAPI still applies response_model.
+    Redis errors fall through to the endpoint.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            key = _cache_key(prefix, kwargs)
+            redis = get_redis()
+
+            try:
+                hit = await redis.get_cached(key)
+                if hit is not None:
+                    return hit
+            except Exception as e:
+                logger.warning("cache_get_failed", key=key, error=str(e))
+
+            result = await func(**kwargs)
+
+            value = result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+            try:
+                await redis.set_cached(key, value, ttl=ttl)
+            except Exception as e:
+                logger.warning("cache_set_failed", key=key, error=str(e))
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(*keys: str, pattern: str | None = None) -> None:
+    """Drop cached entries after a write. Redis errors are logged, not raised."""
+    redis = get_redis()
+    try:
+        await redis.delete_cached(*keys)
+        if pattern:
+            await redis.delete_cached_pattern(pattern)
+    except Exception as e:
+        logger.warning("cache_invalidate_failed", keys=keys, pattern=pattern, error=str(e))
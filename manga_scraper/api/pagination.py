@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, StatementLambdaElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def paginate(
+    db: AsyncSession,
+    query: StatementLambdaElement,
+    page: int,
+    per_page: int,
+) -> tuple[Sequence[Row[Any]], int]:
+    """
+    Execute a paged query and return (rows, total).
+
+    The total is computed with COUNT(*) OVER () alongside the page rows, so the
+    filters run once in a single round-trip. Only a page past the end (no rows
+    to carry the total) falls back to a separate count.
+
+    Queries are lambda statements (``lambda_stmt``) over Core table selects
+    (``select(Model.__table__)``): the statement is built and compiled once per
+    filter combination, and rows come back as plain Row objects without ORM
+    identity-map bookkeeping. The extra ``total`` column is dropped when
+    building response models.
+    """
+    offset = (page - 1) * per_page
+    paged = query + (
+        lambda s: s.add_columns(func.count().over().label("total"))
+        .offset(offset)
+        .limit(per_page)
+    )
+    rows = (await db.execute(paged)).all()
+
+    if rows:
+        return rows, rows[0].total
+
+    if page == 1:
+        return [], 0
+
+    unordered = query + (lambda s: s.order_by(None))
+    count_query = select(func.count()).select_from(unordered.subquery())
+    return [], await db.scalar(count_query) or 0
@@ -3,12 +3,20 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select, and_
+from sqlalchemy import and_, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from manga_scraper.api.cache import cached, invalidate
+from manga_scraper.api.pagination import paginate
 from manga_scraper.core.database import get_db
 from manga_scraper.models import Chapter, ChapterImage, Job, JobType, Series
-from manga_scraper.workers.tasks import scrape_chapter, download_images
+from manga_scraper.workers.tasks import (
+    bulk_delay,
+    delete_stored_images,
+    download_images,
+    scrape_chapter,
+)
 
 router = APIRouter()
 
@@ -72,24 +80,18 @@ async def list_chapters(
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
 
-    query = select(Chapter).where(Chapter.series_id == series_id)
+    query = lambda_stmt(
+        lambda: select(Chapter.__table__).where(Chapter.series_id == series_id)
+    )
 
     if scraped_only:
-        query = query.where(Chapter.is_scraped == True)
-
-    # Count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
-
-    # Paginate
-    query = query.order_by(Chapter.chapter_number.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
+        query += lambda s: s.where(Chapter.is_scraped == True)
 
-    result = await db.execute(query)
-    items = result.scalars().all()
+    query += lambda s: s.order_by(Chapter.chapter_number.desc())
+    items, total = await paginate(db, query, page, per_page)
 
     return ChapterListResponse(
-        items=[ChapterResponse.model_validate(c) for c in items],
+        items=[ChapterResponse.model_construct(**row._mapping) for row in items],
         total=total,
         page=page,
         per_page=per_page,
@@ -97,26 +99,26 @@ async def list_chapters(
 
 
 @router.get("/{chapter_id}", response_model=ChapterDetailResponse)
+@cached("chapter", ttl=60)
 async def get_chapter(
     chapter_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """Get chapter details with images."""
-    chapter = await db.get(Chapter, chapter_id)
-    if not chapter:
-        raise HTTPException(status_code=404, detail="Chapter not found")
-
-    # Get images
     result = await db.execute(
-        select(ChapterImage)
-        .where(ChapterImage.chapter_id == chapter_id)
-        .order_by(ChapterImage.page_number)
+        lambda_stmt(
+            lambda: select(Chapter)
+            .options(selectinload(Chapter.images))
+            .where(Chapter.id == chapter_id)
+        )
     )
-    images = result.scalars().all()
+    chapter = result.scalar_one_or_none()
+    if not chapter:
+        raise HTTPException(status_code=404, detail="Chapter not found")
 
     return ChapterDetailResponse(
         **ChapterResponse.model_validate(chapter).model_dump(),
-        images=[ImageResponse.model_validate(i) for i in images],
+        images=[ImageResponse.model_validate(i) for i in chapter.images],
     )
 
 
@@ -137,19 +139,23 @@ async def scrape_chapter_images(
             detail="Chapter already scraped. Use force=true to re-scrape.",
         )
 
-    job = Job(
-        job_type=JobType.SCRAPE_CHAPTER,
-        chapter_id=chapter_id,
-        series_id=chapter.series_id,
-        input_data={"chapter_url": chapter.source_url},
-    )
-    db.add(job)
-    await db.flush()
+    job_id = (
+        await db.execute(
+            insert(Job)
+            .values(
+                job_type=JobType.SCRAPE_CHAPTER,
+                chapter_id=chapter_id,
+                series_id=chapter.series_id,
+                input_data={"chapter_url": chapter.source_url},
+            )
+            .returning(Job.id)
+        )
+    ).scalar_one()
 
-    scrape_chapter.delay(chapter_id, job.id)
+    scrape_chapter.delay(chapter_id, job_id)
 
     return ScrapeJobResponse(
-        job_id=job.id,
+        job_id=job_id,
         message="Chapter scrape job queued",
     )
 
@@ -181,23 +187,29 @@ async def scrape_all_chapters(
             detail="All chapters already scraped",
         )
 
-    # Create jobs for each chapter
-    job_count = 0
-    for chapter in chapters:
-        job = Job(
-            job_type=JobType.SCRAPE_CHAPTER,
-            chapter_id=chapter.id,
-            series_id=series_id,
-        )
-        db.add(job)
-        await db.flush()
+    # Create jobs for all chapters in one INSERT ... RETURNING
+    result = await db.execute(
+        insert(Job).returning(Job.id, sort_by_parameter_order=True),
+        [
+            {
+                "job_type": JobType.SCRAPE_CHAPTER,
+                "chapter_id": chapter.id,
+                "series_id": series_id,
+            }
+            for chapter in chapters
+        ],
+    )
+    job_ids = result.scalars().all()
 
-        scrape_chapter.delay(chapter.id, job.id)
-        job_count += 1
+    # Publish all tasks over one broker producer
+    bulk_delay(
+        scrape_chapter,
+        ((chapter.id, job_id) for chapter, job_id in zip(chapters, job_ids)),
+    )
 
     return ScrapeJobResponse(
         job_id=0,  # Multiple jobs
-        message=f"Queued {job_count} chapter scrape jobs",
+        message=f"Queued {len(job_ids)} chapter scrape jobs",
     )
 
 
@@ -217,23 +229,27 @@ async def download_chapter_images(
             detail="Chapter not scraped yet. Scrape first.",
         )
 
-    job = Job(
-        job_type=JobType.DOWNLOAD_IMAGES,
-        chapter_id=chapter_id,
-        series_id=chapter.series_id,
-    )
-    db.add(job)
-    await db.flush()
+    job_id = (
+        await db.execute(
+            insert(Job)
+            .values(
+                job_type=JobType.DOWNLOAD_IMAGES,
+                chapter_id=chapter_id,
+                series_id=chapter.series_id,
+            )
+            .returning(Job.id)
+        )
+    ).scalar_one()
 
     download_images.delay(chapter_id)
 
     return ScrapeJobResponse(
-        job_id=job.id,
+        job_id=job_id,
         message="Image download job queued",
     )
 
 
-@router.delete("/{chapter_id}")
+@router.delete("/{chapter_id}", status_code=202)
 async def delete_chapter(
     chapter_id: int,
     db: AsyncSession = Depends(get_db),
@@ -243,11 +259,26 @@ async def delete_chapter(
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    # Delete images from storage
-    from manga_scraper.storage import ImageStorage
-    storage = ImageStorage()
-    await storage.delete_chapter_images(chapter.series_id, chapter_id)
+    # Stored images are deleted by the keys we recorded, once the rows are gone
+    paths = [
+        path
+        for path in (
+            await db.execute(
+                select(ChapterImage.storage_path).where(
+                    ChapterImage.chapter_id == chapter_id,
+                    ChapterImage.storage_path.is_not(None),
+                )
+            )
+        ).scalars()
+        if path is not None
+    ]
 
     await db.delete(chapter)
+    # Commit before queueing: a failed commit must not leave rows pointing at
+    # deleted objects. The middleware's commit is then a no-op.
+    await db.commit()
+    if paths:
+        delete_stored_images.delay(paths)
+    await invalidate(f"chapter:{chapter_id}")
 
     return {"message": "Chapter deleted"}
@@ -34,7 +34,7 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
     # Check Redis
     try:
         redis = get_redis()
-        client = await redis.get_async_client()
+        client = redis.get_async_client()
         await client.ping()
         checks["redis"] = True
     except Exception:
@@ -1,11 +1,13 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from manga_scraper.api.cache import cached
+from manga_scraper.api.pagination import paginate
 from manga_scraper.core.database import get_db
 from manga_scraper.models import Job, JobStatus, JobType
 from manga_scraper.workers.celery_app import celery_app
@@ -60,28 +62,20 @@ async def list_jobs(
     db: AsyncSession = Depends(get_db),
 ):
     """List jobs with filters."""
-    query = select(Job)
+    query = lambda_stmt(lambda: select(Job.__table__))
 
     if status:
-        query = query.where(Job.status == status)
+        query += lambda s: s.where(Job.status == status)
     if job_type:
-        query = query.where(Job.job_type == job_type)
+        query += lambda s: s.where(Job.job_type == job_type)
     if series_id:
-        query = query.where(Job.series_id == series_id)
+        query += lambda s: s.where(Job.series_id == series_id)
 
-    # Count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
-
-    # Paginate
-    query = query.order_by(Job.created_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
+    query += lambda s: s.order_by(Job.created_at.desc())
+    items, total = await paginate(db, query, page, per_page)
 
     return JobListResponse(
-        items=[JobResponse.model_validate(j) for j in items],
+        items=[JobResponse.model_construct(**row._mapping) for row in items],
         total=total,
         page=page,
         per_page=per_page,
@@ -89,15 +83,18 @@ async def list_jobs(
 
 
 @router.get("/stats", response_model=JobStatsResponse)
+@cached("job-stats", ttl=10)
 async def get_job_stats(db: AsyncSession = Depends(get_db)):
     """Get job statistics."""
-    stats = {}
+    tracked = (JobStatus.PENDING, JobStatus.RUNNING, JobStatus.COMPLETED, JobStatus.FAILED)
 
-    for status in [JobStatus.PENDING, JobStatus.RUNNING, JobStatus.COMPLETED, JobStatus.FAILED]:
-        count = await db.scalar(
-            select(func.count()).where(Job.status == status)
-        )
-        stats[status.value] = count or 0
+    result = await db.execute(
+        select(Job.status, func.count())
+        .where(Job.status.in_(tracked))
+        .group_by(Job.status)
+    )
+    counts: dict[JobStatus, int] = {status: count for status, count in result}
+    stats = {status.value: counts.get(status, 0) for status in tracked}
 
     total = sum(stats.values())
 
@@ -123,9 +120,10 @@ async def get_job(
     return JobResponse.model_validate(job)
 
 
-@router.post("/{job_id}/cancel")
+@router.post("/{job_id}/cancel", status_code=202)
 async def cancel_job(
     job_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Cancel a pending or running job."""
@@ -139,12 +137,14 @@ async def cancel_job(
             detail=f"Job already finished with status: {job.status}",
         )
 
-    # Revoke Celery task
+    # Revoke Celery task after responding (broker RPC, runs in threadpool)
     if job.celery_task_id:
-        celery_app.control.revoke(job.celery_task_id, terminate=True)
+        background_tasks.add_task(
+            celery_app.control.revoke, job.celery_task_id, terminate=True
+        )
 
     job.status = JobStatus.CANCELLED
-    job.completed_at = datetime.utcnow()
+    job.completed_at = func.now()
 
     return {"message": "Job cancelled"}
 
@@ -3,9 +3,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy import func, select
+from sqlalchemy import insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from manga_scraper.api.cache import cached, invalidate
+from manga_scraper.api.pagination import paginate
 from manga_scraper.core.database import get_db
 from manga_scraper.models import Job, JobStatus, JobType, Series, SeriesStatus
 from manga_scraper.scrapers import get_scraper_for_url, get_supported_domains
@@ -59,6 +61,7 @@ class ScrapeJobResponse(BaseModel):
 
 # Routes
 @router.get("/supported-sites")
+@cached("supported-sites", ttl=3600)
 async def get_supported_sites():
     """Get list of supported scraping sites."""
     return {"sites": get_supported_domains()}
@@ -79,7 +82,7 @@ async def add_series(
     if not scraper:
         raise HTTPException(
             status_code=400,
-            detail=f"URL not supported. Supported sites: {get_supported_domains()}",
+            detail=f"URL not supported. Supported sites: {', '.join(get_supported_domains())}",
         )
 
     # Check if already exists
@@ -93,18 +96,22 @@ async def add_series(
         )
 
     # Create job
-    job = Job(
-        job_type=JobType.SCRAPE_SERIES,
-        input_data={"url": url},
-    )
-    db.add(job)
-    await db.flush()
+    job_id = (
+        await db.execute(
+            insert(Job)
+            .values(
+                job_type=JobType.SCRAPE_SERIES,
+                input_data={"url": url},
+            )
+            .returning(Job.id)
+        )
+    ).scalar_one()
 
     # Queue scrape task
-    scrape_series.delay(url, job.id)
+    scrape_series.delay(url, job_id)
 
     return ScrapeJobResponse(
-        job_id=job.id,
+        job_id=job_id,
         message="Series scrape job queued",
     )
 
@@ -119,29 +126,22 @@ async def list_series(
     db: AsyncSession = Depends(get_db),
 ):
     """List all series with pagination and filters."""
-    query = select(Series)
+    query = lambda_stmt(lambda: select(Series.__table__))
 
     # Apply filters
     if status:
-        query = query.where(Series.status == status)
+        query += lambda s: s.where(Series.status == status)
     if source_site:
-        query = query.where(Series.source_site == source_site)
+        query += lambda s: s.where(Series.source_site == source_site)
     if search:
-        query = query.where(Series.title.ilike(f"%{search}%"))
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+        pattern = f"%{search}%"
+        query += lambda s: s.where(Series.title.ilike(pattern))
 
-    # Paginate
-    query = query.order_by(Series.updated_at.desc())
-    query = query.offset((page - 1) * per_page).limit(per_page)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
+    query += lambda s: s.order_by(Series.updated_at.desc())
+    items, total = await paginate(db, query, page, per_page)
 
     return SeriesListResponse(
-        items=[SeriesResponse.model_validate(s) for s in items],
+        items=[SeriesResponse.model_construct(**row._mapping) for row in items],
         total=total,
         page=page,
         per_page=per_page,
@@ -150,6 +150,7 @@ async def list_series(
 
 
 @router.get("/{series_id}", response_model=SeriesResponse)
+@cached("series", ttl=300)
 async def get_series(
     series_id: int,
     db: AsyncSession = Depends(get_db),
@@ -173,6 +174,7 @@ async def delete_series(
         raise HTTPException(status_code=404, detail="Series not found")
 
     await db.delete(series)
+    await invalidate(f"series:{series_id}", pattern="chapter:*")
     return {"message": "Series deleted"}
 
 
@@ -186,18 +188,23 @@ async def refresh_series(
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
 
-    job = Job(
-        job_type=JobType.CHECK_UPDATES,
-        series_id=series_id,
-        input_data={"url": series.source_url},
-    )
-    db.add(job)
-    await db.flush()
+    job_id = (
+        await db.execute(
+            insert(Job)
+            .values(
+                job_type=JobType.CHECK_UPDATES,
+                series_id=series_id,
+                input_data={"url": series.source_url},
+            )
+            .returning(Job.id)
+        )
+    ).scalar_one()
 
-    scrape_series.delay(series.source_url, job.id)
+    scrape_series.delay(series.source_url, job_id)
+    await invalidate(f"series:{series_id}")
 
     return ScrapeJobResponse(
-        job_id=job.id,
+        job_id=job_id,
         message="Refresh job queued",
     )
 
@@ -213,6 +220,7 @@ async def toggle_series_active(
         raise HTTPException(status_code=404, detail="Series not found")
 
     series.is_active = not series.is_active
+    await invalidate(f"series:{series_id}")
 
     return {
         "id": series_id,
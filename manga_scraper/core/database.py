@@ -1,7 +1,8 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -11,10 +12,16 @@ from manga_scraper.models.base import Base
 # Async engine for FastAPI
 async_engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
-    pool_size=10,
-    max_overflow=20,
+    echo=settings.sqlalchemy_echo,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle,
     pool_pre_ping=True,
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.database_pgbouncer
+        else {}
+    ),
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -28,9 +35,10 @@ AsyncSessionLocal = async_sessionmaker(
 # Sync engine for Celery workers
 sync_engine = create_engine(
     settings.database_url_sync,
-    echo=settings.debug,
+    echo=settings.sqlalchemy_echo,
     pool_size=5,
     max_overflow=10,
+    pool_recycle=settings.database_pool_recycle,
     pool_pre_ping=True,
 )
 
@@ -46,20 +54,18 @@ SyncSessionLocal = sessionmaker(
 async def init_db() -> None:
     """Initialize database tables."""
     async with async_engine.begin() as conn:
+        # Required by the trigram index on series.title
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency for async database sessions."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+def get_db(request: Request) -> AsyncSession:
+    """
+    FastAPI dependency for async database sessions.
+    The session is opened and committed by the API's request middleware.
+    """
+    session: AsyncSession = request.state.db
+    return session
 
 
 @asynccontextmanager
@@ -2,6 +2,7 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -23,22 +24,25 @@ def setup_logging() -> None:
     ]
 
     # Development: pretty console output
-    # Production: JSON output
+    # Production: JSON output, rendered to bytes by orjson and written as-is
+    logger_factory: Any
     if settings.is_production:
         shared_processors.extend([
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ])
+        logger_factory = structlog.BytesLoggerFactory()
     else:
         shared_processors.extend([
             structlog.dev.ConsoleRenderer(colors=True),
         ])
+        logger_factory = structlog.PrintLoggerFactory()
 
     structlog.configure(
         processors=shared_processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -54,7 +58,7 @@ def setup_logging() -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(
-        logging.INFO if settings.debug else logging.WARNING
+        logging.INFO if settings.sqlalchemy_echo else logging.WARNING
     )
 
 
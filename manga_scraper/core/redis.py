@@ -1,121 +1,286 @@
-import json
+import secrets
+from collections.abc import Awaitable
 from datetime import timedelta
-from typing import Any
+from typing import Any, cast
 
+import msgspec
 import redis.asyncio as aioredis
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
+from redis.commands.core import AsyncScript
 
 from manga_scraper.config import settings
 
+# Cache values and cookies are stored as msgpack bytes. msgspec encodes in C
+# with no intermediate str, and the payload is smaller than JSON.
+_CACHE_ENCODER = msgspec.msgpack.Encoder()
+_CACHE_DECODER = msgspec.msgpack.Decoder()
+
+# Token bucket holding up to ARGV[1] tokens, refilled at ARGV[2] tokens/ms.
+# Uses the server clock so workers never disagree about elapsed time.
+# Takes a token and returns {0, tokens left}, or {ms until one is available,
+# 0} (whole tokens; Lua numbers are truncated to integers on the way back).
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {wait, math.floor(tokens)}
+"""
+
+# Delete the lock only if it still holds our token, so a holder whose lock
+# expired cannot release one that another worker has since acquired.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _clearance(user_agent: str | None) -> bytes:
+    """Encode a new clearance record for a cf_ok key."""
+    return _CACHE_ENCODER.encode({"id": secrets.token_hex(8), "user_agent": user_agent})
+
 
 class RedisClient:
-    """Redis client wrapper with common operations."""
+    """
+    Redis client wrapper with common operations.
+    Clients return raw bytes; the helpers below own (de)serialization.
+    Both pools block for a free connection at the cap instead of raising.
+    """
 
     def __init__(self, url: str | None = None):
         self.url = url or settings.redis_url
+        self._async_pool: aioredis.BlockingConnectionPool | None = None
         self._async_client: aioredis.Redis | None = None
+        self._sync_pool: BlockingConnectionPool | None = None
         self._sync_client: Redis | None = None
+        self._token_bucket_script: AsyncScript | None = None
+        self._release_lock_script: AsyncScript | None = None
 
-    async def get_async_client(self) -> aioredis.Redis:
-        if self._async_client is None:
-            self._async_client = await aioredis.from_url(
-                self.url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+    def get_async_client(self) -> aioredis.Redis:
+        # Plain method: building the client does no I/O, and callers skip a coroutine frame
+        return self._async_client or self._make_async_client()
+
+    def _make_async_client(self) -> aioredis.Redis:
+        self._async_pool = aioredis.BlockingConnectionPool.from_url(
+            self.url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+        )
+        self._async_client = aioredis.Redis(connection_pool=self._async_pool)
         return self._async_client
 
     def get_sync_client(self) -> Redis:
         if self._sync_client is None:
-            self._sync_client = Redis.from_url(
+            self._sync_pool = BlockingConnectionPool.from_url(
                 self.url,
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout,
             )
+            self._sync_client = Redis(connection_pool=self._sync_pool)
         return self._sync_client
 
     async def close(self) -> None:
-        if self._async_client:
-            await self._async_client.close()
-        if self._sync_client:
+        if self._async_client and self._async_pool:
+            await self._async_client.aclose()
+            await self._async_pool.disconnect()
+            self._async_client = self._async_pool = None
+            self._token_bucket_script = self._release_lock_script = None
+        if self._sync_client and self._sync_pool:
             self._sync_client.close()
+            # redis-py leaves the sync pool's disconnect() unannotated
+            self._sync_pool.disconnect()  # type: ignore[no-untyped-call]
+            self._sync_client = self._sync_pool = None
 
     # Rate limiting
-    async def check_rate_limit(self, key: str, limit: int, window: int = 60) -> bool:
-        """Check if rate limit is exceeded. Returns True if allowed."""
-        client = await self.get_async_client()
-        current = await client.get(key)
-
-        if current is None:
-            await client.setex(key, window, 1)
-            return True
-
-        if int(current) >= limit:
-            return False
+    async def take_rate_limit_token(
+        self, key: str, limit: int, window: int = 60
+    ) -> tuple[int, int]:
+        """
+        Take a token from a bucket refilling limit tokens per window seconds.
+        Returns (0, tokens left) if allowed, else (milliseconds to wait
+        before retrying, 0).
+        """
+        client = self.get_async_client()
+        if self._token_bucket_script is None:
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT
+            self._token_bucket_script = client.register_script(_TOKEN_BUCKET_SCRIPT)
 
-        await client.incr(key)
-        return True
+        rate = limit / (window * 1000)
+        wait, remaining = await self._token_bucket_script(keys=[key], args=[limit, rate])
+        return int(wait), int(remaining)
 
     async def get_rate_limit_remaining(self, key: str, limit: int) -> int:
-        """Get remaining requests in rate limit window."""
-        client = await self.get_async_client()
-        current = await client.get(key)
-        if current is None:
+        """Whole tokens left in a bucket as of its last take (refill not counted)."""
+        client = self.get_async_client()
+        tokens = await cast("Awaitable[bytes | None]", client.hget(key, "tokens"))
+        if tokens is None:
             return limit
-        return max(0, limit - int(current))
+        return int(float(tokens))
 
     # Cookie/Session storage
-    async def store_cookies(self, domain: str, cookies: list[dict]) -> None:
-        """Store browser cookies for domain."""
-        client = await self.get_async_client()
+    # One hash per domain (field = cookie name) so single cookies can be
+    # read or updated without rewriting the whole jar.
+    async def store_cookies(
+        self,
+        domain: str,
+        cookies: list[dict[str, Any]],
+        cf_ttl: int = 0,
+        user_agent: str | None = None,
+    ) -> None:
+        """
+        Store browser cookies for domain. A positive cf_ttl also marks the
+        domain cf-cleared (see mark_cf_cleared) in the same round trip,
+        recording the user_agent the cookies were issued to.
+        """
+        mapping = {
+            cookie["name"]: _CACHE_ENCODER.encode(cookie)
+            for cookie in cookies
+            if cookie.get("name")
+        }
+        if not mapping:
+            return
+        client = self.get_async_client()
         key = f"cookies:{domain}"
-        await client.setex(key, timedelta(hours=2), json.dumps(cookies))
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, timedelta(hours=2))
+            if cf_ttl > 0:
+                pipe.setex(f"cf_ok:{domain}", cf_ttl, _clearance(user_agent))
+            await pipe.execute()
 
-    async def get_cookies(self, domain: str) -> list[dict] | None:
+    async def get_cookies(self, domain: str) -> list[dict[str, Any]] | None:
         """Get stored cookies for domain."""
-        client = await self.get_async_client()
-        key = f"cookies:{domain}"
-        data = await client.get(key)
+        client = self.get_async_client()
+        # redis-py types hash replies as sync-or-async; ours is always async
+        data = await cast(
+            "Awaitable[dict[bytes, bytes]]", client.hgetall(f"cookies:{domain}")
+        )
         if data:
-            return json.loads(data)
+            cookies: list[dict[str, Any]] = [
+                _CACHE_DECODER.decode(value) for value in data.values()
+            ]
+            return cookies
         return None
 
+    async def get_cookie(self, domain: str, name: str) -> dict[str, Any] | None:
+        """Get a single stored cookie for domain."""
+        client = self.get_async_client()
+        data = await cast(
+            "Awaitable[bytes | None]", client.hget(f"cookies:{domain}", name)
+        )
+        if data:
+            cookie: dict[str, Any] = _CACHE_DECODER.decode(data)
+            return cookie
+        return None
+
+    # Cloudflare clearance: set after a browser visit stores cookies, so
+    # browser-only sites can try plain HTTP until the clearance expires.
+    # Each clearance gets a new id, so HTTP clients know when to reload cookies.
+    async def mark_cf_cleared(
+        self, domain: str, ttl: int = 1800, user_agent: str | None = None
+    ) -> None:
+        """Record that domain's stored cookies should pass Cloudflare."""
+        client = self.get_async_client()
+        await client.setex(f"cf_ok:{domain}", ttl, _clearance(user_agent))
+
+    async def get_cf_clearance(self, domain: str) -> dict[str, Any] | None:
+        """
+        Domain's live clearance as {"id", "user_agent"}, or None if it has
+        none. user_agent is None when the browser's wasn't recorded.
+        """
+        client = self.get_async_client()
+        data = await client.get(f"cf_ok:{domain}")
+        if data:
+            clearance: dict[str, Any] = _CACHE_DECODER.decode(data)
+            return clearance
+        return None
+
+    async def clear_cf_cleared(self, domain: str) -> None:
+        """Drop domain's clearance flag after HTTP got challenged again."""
+        client = self.get_async_client()
+        await client.delete(f"cf_ok:{domain}")
+
     # URL deduplication
     async def is_url_scraped(self, url: str) -> bool:
         """Check if URL has been scraped recently."""
-        client = await self.get_async_client()
+        client = self.get_async_client()
         return await client.sismember("scraped_urls", url)
 
     async def mark_url_scraped(self, url: str, ttl: int = 86400) -> None:
         """Mark URL as scraped."""
-        client = await self.get_async_client()
-        await client.sadd("scraped_urls", url)
-        await client.expire("scraped_urls", ttl)
+        client = self.get_async_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.sadd("scraped_urls", url)
+            pipe.expire("scraped_urls", ttl)
+            await pipe.execute()
 
     # Generic cache operations
     async def get_cached(self, key: str) -> Any | None:
         """Get cached value."""
-        client = await self.get_async_client()
+        client = self.get_async_client()
         data = await client.get(f"cache:{key}")
         if data:
-            return json.loads(data)
+            return _CACHE_DECODER.decode(data)
         return None
 
     async def set_cached(self, key: str, value: Any, ttl: int = 3600) -> None:
         """Set cached value."""
-        client = await self.get_async_client()
-        await client.setex(f"cache:{key}", ttl, json.dumps(value))
+        client = self.get_async_client()
+        await client.setex(f"cache:{key}", ttl, _CACHE_ENCODER.encode(value))
+
+    async def delete_cached(self, *keys: str) -> None:
+        """Delete cached values."""
+        if not keys:
+            return
+        client = self.get_async_client()
+        await client.delete(*(f"cache:{key}" for key in keys))
+
+    async def delete_cached_pattern(self, pattern: str) -> int:
+        """Delete all cached values whose key matches a glob pattern."""
+        client = self.get_async_client()
+        keys = [key async for key in client.scan_iter(match=f"cache:{pattern}", count=500)]
+        if keys:
+            await client.delete(*keys)
+        return len(keys)
+
+    def delete_cached_sync(self, *keys: str) -> None:
+        """Delete cached values (sync, for Celery workers)."""
+        if not keys:
+            return
+        client = self.get_sync_client()
+        client.delete(*(f"cache:{key}" for key in keys))
 
     # Lock for distributed operations
-    async def acquire_lock(self, name: str, timeout: int = 30) -> bool:
-        """Acquire distributed lock."""
-        client = await self.get_async_client()
-        return await client.set(f"lock:{name}", "1", nx=True, ex=timeout)
-
-    async def release_lock(self, name: str) -> None:
-        """Release distributed lock."""
-        client = await self.get_async_client()
-        await client.delete(f"lock:{name}")
+    async def acquire_lock(self, name: str, timeout: int = 30) -> str | None:
+        """Acquire distributed lock. Returns the token needed to release it, or None."""
+        client = self.get_async_client()
+        token = secrets.token_hex(8)
+        if await client.set(f"lock:{name}", token, nx=True, ex=timeout):
+            return token
+        return None
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release distributed lock if it is still held with token."""
+        client = self.get_async_client()
+        if self._release_lock_script is None:
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT
+            self._release_lock_script = client.register_script(_RELEASE_LOCK_SCRIPT)
+
+        return bool(await self._release_lock_script(keys=[f"lock:{name}"], args=[token]))
 
 
 # Global instance
@@ -0,0 +1,192 @@
+"""Create the initial schema
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0000"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# SQLAlchemy's Enum stores member names, so these mirror the enum classes
+_ENUMS = {
+    "seriesstatus": ("ONGOING", "COMPLETED", "HIATUS", "CANCELLED", "UNKNOWN"),
+    "jobtype": (
+        "SCRAPE_SERIES",
+        "SCRAPE_CHAPTER",
+        "DOWNLOAD_IMAGES",
+        "CHECK_UPDATES",
+        "FULL_SYNC",
+    ),
+    "jobstatus": ("PENDING", "RUNNING", "COMPLETED", "FAILED", "CANCELLED", "RETRY"),
+}
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    return postgresql.ENUM(*_ENUMS[name], name=name, create_type=False)
+
+
+def _common_columns() -> list[sa.schema.SchemaItem]:
+    return [
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    ]
+
+
+def upgrade() -> None:
+    # Every step is guarded so databases already built by init_db()
+    # (create_all) can be upgraded too
+    for name, values in _ENUMS.items():
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"""
+            DO $$ BEGIN
+                CREATE TYPE {name} AS ENUM ({labels});
+            EXCEPTION WHEN duplicate_object THEN NULL;
+            END $$
+            """
+        )
+
+    op.create_table(
+        "series",
+        sa.Column("slug", sa.String(255), nullable=False),
+        sa.Column("source_site", sa.String(100), nullable=False),
+        sa.Column("source_id", sa.String(255), nullable=False),
+        sa.Column("source_url", sa.String(1024), nullable=False),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("title_alt", postgresql.ARRAY(sa.String(500))),
+        sa.Column("description", sa.Text()),
+        sa.Column("cover_url", sa.String(1024)),
+        sa.Column("cover_path", sa.String(500)),
+        sa.Column("status", _enum("seriesstatus"), nullable=False),
+        sa.Column("genres", postgresql.ARRAY(sa.String(100))),
+        sa.Column("authors", postgresql.ARRAY(sa.String(200))),
+        sa.Column("artists", postgresql.ARRAY(sa.String(200))),
+        sa.Column("total_chapters", sa.Integer(), nullable=False),
+        sa.Column("latest_chapter", sa.Float()),
+        sa.Column("rating", sa.Float()),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("last_checked_at", sa.DateTime(timezone=True)),
+        sa.Column("last_chapter_at", sa.DateTime(timezone=True)),
+        sa.Column("extra_data", postgresql.JSONB()),
+        *_common_columns(),
+        sa.UniqueConstraint("source_site", "source_id", name="uq_series_source"),
+        sa.UniqueConstraint("slug"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_series_slug", "series", ["slug"], if_not_exists=True)
+    op.create_index("ix_series_status", "series", ["status"], if_not_exists=True)
+    op.create_index("ix_series_source_site", "series", ["source_site"], if_not_exists=True)
+
+    op.create_table(
+        "chapters",
+        sa.Column(
+            "series_id",
+            sa.Integer(),
+            sa.ForeignKey("series.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("chapter_number", sa.Float(), nullable=False),
+        sa.Column("source_url", sa.String(1024), nullable=False),
+        sa.Column("source_id", sa.String(255)),
+        sa.Column("title", sa.String(500)),
+        sa.Column("volume", sa.Integer()),
+        sa.Column("release_date", sa.DateTime(timezone=True)),
+        sa.Column("is_scraped", sa.Boolean(), nullable=False),
+        sa.Column("scraped_at", sa.DateTime(timezone=True)),
+        sa.Column("total_images", sa.Integer(), nullable=False),
+        sa.Column("images_path", sa.String(500)),
+        sa.Column("extra_data", postgresql.JSONB()),
+        *_common_columns(),
+        sa.UniqueConstraint("series_id", "chapter_number", name="uq_chapter_series_number"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_chapters_series_id", "chapters", ["series_id"], if_not_exists=True)
+    op.create_index("ix_chapters_number", "chapters", ["chapter_number"], if_not_exists=True)
+    op.create_index("ix_chapters_scraped", "chapters", ["is_scraped"], if_not_exists=True)
+
+    op.create_table(
+        "chapter_images",
+        sa.Column(
+            "chapter_id",
+            sa.Integer(),
+            sa.ForeignKey("chapters.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("page_number", sa.Integer(), nullable=False),
+        sa.Column("source_url", sa.String(1024), nullable=False),
+        sa.Column("storage_path", sa.String(500)),
+        sa.Column("storage_url", sa.String(1024)),
+        sa.Column("width", sa.Integer()),
+        sa.Column("height", sa.Integer()),
+        sa.Column("file_size", sa.Integer()),
+        sa.Column("content_type", sa.String(50)),
+        sa.Column("is_downloaded", sa.Boolean(), nullable=False),
+        *_common_columns(),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_images_chapter_id", "chapter_images", ["chapter_id"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_images_page_number", "chapter_images", ["page_number"], if_not_exists=True
+    )
+
+    op.create_table(
+        "jobs",
+        sa.Column("celery_task_id", sa.String(255)),
+        sa.Column("job_type", _enum("jobtype"), nullable=False),
+        sa.Column("status", _enum("jobstatus"), nullable=False),
+        sa.Column("series_id", sa.Integer(), sa.ForeignKey("series.id", ondelete="SET NULL")),
+        sa.Column(
+            "chapter_id", sa.Integer(), sa.ForeignKey("chapters.id", ondelete="SET NULL")
+        ),
+        sa.Column("input_data", postgresql.JSONB()),
+        sa.Column("result_data", postgresql.JSONB()),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("total_items", sa.Integer(), nullable=False),
+        sa.Column("processed_items", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("completed_at", sa.DateTime(timezone=True)),
+        sa.Column("retry_count", sa.Integer(), nullable=False),
+        sa.Column("max_retries", sa.Integer(), nullable=False),
+        sa.Column("error_message", sa.Text()),
+        sa.Column("error_traceback", sa.Text()),
+        *_common_columns(),
+        sa.UniqueConstraint("celery_task_id"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_jobs_status", "jobs", ["status"], if_not_exists=True)
+    op.create_index("ix_jobs_type", "jobs", ["job_type"], if_not_exists=True)
+    op.create_index("ix_jobs_celery_id", "jobs", ["celery_task_id"], if_not_exists=True)
+    op.create_index("ix_jobs_series_id", "jobs", ["series_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("jobs")
+    op.drop_table("chapter_images")
+    op.drop_table("chapters")
+    op.drop_table("series")
+    for name in reversed(_ENUMS):
+        op.execute(f"DROP TYPE {name}")
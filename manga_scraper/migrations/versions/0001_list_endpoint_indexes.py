@@ -0,0 +1,64 @@
+"""Add composite indexes for list endpoints
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | None = "0000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_chapters_series_scraped_num",
+        "chapters",
+        ["series_id", "is_scraped", "chapter_number"],
+        if_not_exists=True,
+    )
+
+    op.drop_index("ix_series_status", table_name="series", if_exists=True)
+    op.create_index(
+        "ix_series_status_updated", "series", ["status", "updated_at"], if_not_exists=True
+    )
+    op.create_index("ix_series_updated", "series", ["updated_at"], if_not_exists=True)
+    op.create_index(
+        "ix_series_title_trgm",
+        "series",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+
+    op.drop_index("ix_jobs_status", table_name="jobs", if_exists=True)
+    op.drop_index("ix_jobs_series_id", table_name="jobs", if_exists=True)
+    op.create_index(
+        "ix_jobs_status_created", "jobs", ["status", "created_at"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_jobs_series_created", "jobs", ["series_id", "created_at"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_series_created", table_name="jobs")
+    op.drop_index("ix_jobs_status_created", table_name="jobs")
+    op.create_index("ix_jobs_series_id", "jobs", ["series_id"])
+    op.create_index("ix_jobs_status", "jobs", ["status"])
+
+    op.drop_index("ix_series_title_trgm", table_name="series")
+    op.drop_index("ix_series_updated", table_name="series")
+    op.drop_index("ix_series_status_updated", table_name="series")
+    op.create_index("ix_series_status", "series", ["status"])
+
+    op.drop_index("ix_chapters_series_scraped_num", table_name="chapters")
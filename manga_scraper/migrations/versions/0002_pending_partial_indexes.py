@@ -0,0 +1,41 @@
+"""Add partial indexes for unscraped chapters and undownloaded images
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_chapters_scraped", table_name="chapters", if_exists=True)
+    op.create_index(
+        "ix_chapters_pending",
+        "chapters",
+        ["series_id", "chapter_number"],
+        postgresql_where=sa.text("is_scraped = false"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_images_pending",
+        "chapter_images",
+        ["chapter_id", "page_number"],
+        postgresql_where=sa.text("is_downloaded = false"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_images_pending", table_name="chapter_images")
+    op.drop_index("ix_chapters_pending", table_name="chapters")
+    op.create_index("ix_chapters_scraped", "chapters", ["is_scraped"])
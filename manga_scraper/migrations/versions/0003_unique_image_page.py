@@ -0,0 +1,46 @@
+"""Make (chapter_id, page_number) unique on chapter images
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep the oldest row of any page that concurrent scrapes inserted twice
+    op.execute(
+        """
+        DELETE FROM chapter_images a
+        USING chapter_images b
+        WHERE a.chapter_id = b.chapter_id
+          AND a.page_number = b.page_number
+          AND a.id > b.id
+        """
+    )
+    # Databases built by init_db() (create_all) already have the constraint
+    op.execute(
+        """
+        DO $$ BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = 'uq_image_chapter_page'
+            ) THEN
+                ALTER TABLE chapter_images
+                    ADD CONSTRAINT uq_image_chapter_page UNIQUE (chapter_id, page_number);
+            END IF;
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_image_chapter_page", "chapter_images", type_="unique")
@@ -0,0 +1,29 @@
+"""Add (status, completed_at) index for old job cleanup
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_jobs_status_completed",
+        "jobs",
+        ["status", "completed_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status_completed", table_name="jobs")
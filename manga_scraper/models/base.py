@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Any
+from operator import attrgetter
+from typing import Any, ClassVar
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -25,5 +26,16 @@ class Base(DeclarativeBase):
         nullable=False,
     )
 
+    # Filled per mapped subclass so to_dict doesn't walk __table__.columns per row
+    _column_names: ClassVar[tuple[str, ...]] = ()
+    _column_getter: ClassVar["attrgetter[tuple[Any, ...]]"]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        table = getattr(cls, "__table__", None)
+        if table is not None:
+            cls._column_names = tuple(c.name for c in table.columns)
+            cls._column_getter = attrgetter(*cls._column_names)
+
     def to_dict(self) -> dict[str, Any]:
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return dict(zip(self._column_names, self._column_getter(self)))
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,7 +13,14 @@ class Chapter(Base):
         UniqueConstraint("series_id", "chapter_number", name="uq_chapter_series_number"),
         Index("ix_chapters_series_id", "series_id"),
         Index("ix_chapters_number", "chapter_number"),
-        Index("ix_chapters_scraped", "is_scraped"),
+        # Partial: only the unscraped working set the scrape-all path reads
+        Index(
+            "ix_chapters_pending",
+            "series_id",
+            "chapter_number",
+            postgresql_where=text("is_scraped = false"),
+        ),
+        Index("ix_chapters_series_scraped_num", "series_id", "is_scraped", "chapter_number"),
     )
 
     # Foreign key
@@ -49,7 +56,9 @@ class Chapter(Base):
         "ChapterImage",
         back_populates="chapter",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+        order_by="ChapterImage.page_number",
     )
 
     def __repr__(self) -> str:
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from manga_scraper.models.base import Base
@@ -7,8 +7,16 @@ from manga_scraper.models.base import Base
 class ChapterImage(Base):
     __tablename__ = "chapter_images"
     __table_args__ = (
+        UniqueConstraint("chapter_id", "page_number", name="uq_image_chapter_page"),
         Index("ix_images_chapter_id", "chapter_id"),
         Index("ix_images_page_number", "page_number"),
+        # Partial: only images download_images still has to fetch
+        Index(
+            "ix_images_pending",
+            "chapter_id",
+            "page_number",
+            postgresql_where=text("is_downloaded = false"),
+        ),
     )
 
     # Foreign key
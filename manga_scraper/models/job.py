@@ -28,10 +28,11 @@ class JobStatus(str, enum.Enum):
 class Job(Base):
     __tablename__ = "jobs"
     __table_args__ = (
-        Index("ix_jobs_status", "status"),
+        Index("ix_jobs_status_created", "status", "created_at"),
         Index("ix_jobs_type", "job_type"),
         Index("ix_jobs_celery_id", "celery_task_id"),
-        Index("ix_jobs_series_id", "series_id"),
+        Index("ix_jobs_series_created", "series_id", "created_at"),
+        Index("ix_jobs_status_completed", "status", "completed_at"),
     )
 
     # Job identification
@@ -22,8 +22,15 @@ class Series(Base):
     __table_args__ = (
         UniqueConstraint("source_site", "source_id", name="uq_series_source"),
         Index("ix_series_slug", "slug"),
-        Index("ix_series_status", "status"),
+        Index("ix_series_status_updated", "status", "updated_at"),
         Index("ix_series_source_site", "source_site"),
+        Index("ix_series_updated", "updated_at"),
+        Index(
+            "ix_series_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
     )
 
     # Identifiers
@@ -67,7 +74,8 @@ class Series(Base):
         "Chapter",
         back_populates="series",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,3 +1,5 @@
+import re
+from functools import cache, lru_cache
 from urllib.parse import urlparse
 
 from manga_scraper.scrapers.base import BaseScraper
@@ -17,31 +19,73 @@ SCRAPER_REGISTRY: dict[str, type[BaseScraper]] = {
 }
 
 # Domains that require browser (Cloudflare protected)
-BROWSER_REQUIRED_DOMAINS = {
+BROWSER_REQUIRED_DOMAINS = frozenset({
     "asuracomic.net",
     "www.asuracomic.net",
     "asura.nacm.xyz",
     "manhwatop.com",
     "www.manhwatop.com",
-}
+})
 
+_SUPPORTED_DOMAINS: tuple[str, ...] = tuple(sorted(SCRAPER_REGISTRY))
+
+# The netloc runs up to the first "/", "?" or "#", as in urlsplit
+_HTTP_NETLOC_RE = re.compile(r"https?://([^/?#]*)")
 
-def get_scraper_for_url(url: str) -> BaseScraper | None:
-    """Get appropriate scraper instance for URL."""
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
 
-    scraper_class = SCRAPER_REGISTRY.get(domain)
-    if scraper_class:
-        requires_browser = domain in BROWSER_REQUIRED_DOMAINS
-        return scraper_class(requires_browser=requires_browser)
+def _netloc(url: str) -> str:
+    """Extract the netloc, skipping urlparse for plain http(s) URLs."""
+    match = _HTTP_NETLOC_RE.match(url)
+    if match:
+        return match.group(1)
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=256)
+def _resolve_domain(domain: str) -> tuple[type[BaseScraper], bool] | None:
+    """
+    Resolve a netloc to its scraper class and browser requirement.
+    Unlisted subdomains (CDN/mirror hosts) fall back to the nearest
+    registered parent domain, one dict lookup per label.
+    """
+    domain = domain.lower().partition(":")[0]
+    while domain:
+        scraper_class = SCRAPER_REGISTRY.get(domain)
+        if scraper_class:
+            return scraper_class, domain in BROWSER_REQUIRED_DOMAINS
+        domain = domain.partition(".")[2]
+    return None
+
+
+@cache
+def _get_scraper_instance(
+    scraper_class: type[BaseScraper], requires_browser: bool
+) -> BaseScraper:
+    """
+    One shared instance per (class, browser mode). The instance holds no
+    connections; it fetches through the running loop's shared HTTP client
+    and browser pool.
+    """
+    return scraper_class(requires_browser=requires_browser)
+
+
+def get_scraper_for_url(url: str) -> BaseScraper | None:
+    """
+    Get appropriate scraper instance for URL.
+    Instances are shared and safe to use from any event loop. The HTTP
+    client and browser pool they use are kept per loop and closed by the
+    loop's owner (close_shared_client / close_browser_pool), not by close().
+    """
+    resolved = _resolve_domain(_netloc(url))
+    if resolved:
+        return _get_scraper_instance(*resolved)
 
     return None
 
 
-def get_supported_domains() -> list[str]:
-    """Get list of supported domains."""
-    return list(set(SCRAPER_REGISTRY.keys()))
+def get_supported_domains() -> tuple[str, ...]:
+    """Get supported domains (precomputed; the registry is fixed at import)."""
+    return _SUPPORTED_DOMAINS
 
 
 __all__ = [
@@ -3,8 +3,24 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
+from selectolax.lexbor import LexborNode
+
 from manga_scraper.scrapers.base import BaseScraper
 
+# Compiled once at import; used on every series/chapter page
+_ASURA_SUFFIX_RE = re.compile(r"\s*[-–]\s*Asura\s*Scans?\s*$", re.I)
+_CHAPTER_NUM_RE = re.compile(r"chapter[/-](\d+(?:\.\d+)?)", re.I)
+_LABEL_RE = re.compile(r"Status|Author|Artist", re.I)
+
+# Chapter image selectors, most specific first
+_IMAGE_SELECTORS = (
+    "img[src*='storage/media']",
+    "img[alt*='chapter']",
+    ".w-full img[src*='asura']",
+    "img.max-w-full",
+)
+_IMAGE_SELECTOR = ", ".join(_IMAGE_SELECTORS)
+
 
 class AsuraScraper(BaseScraper):
     """
@@ -16,6 +32,9 @@ class AsuraScraper(BaseScraper):
     BASE_URL = "https://asuracomic.net"
     REQUIRES_BROWSER = True
 
+    # Substrings marking non-chapter images (matched against the lowercased src)
+    SKIP_TOKENS = ("logo", "icon", "avatar", "banner", "ads", "placeholder")
+
     async def scrape_series(self, url: str) -> dict[str, Any]:
         """Scrape series metadata and chapter list."""
         # Wait for series content to load
@@ -23,7 +42,9 @@ class AsuraScraper(BaseScraper):
             url,
             wait_selector="img[alt*='poster'], .grid img",
         )
-        soup = self.parse_html(html)
+        # Inline scripts carry the Next.js payload, often larger than the
+        # visible page; the label walk below would scan all of it
+        tree = self.parse_html(html, skip_tags=("script", "style"))
 
         # Extract source ID from URL
         parsed = urlparse(url)
@@ -32,19 +53,19 @@ class AsuraScraper(BaseScraper):
         source_id = path_parts[-1] if path_parts else ""
 
         # Title - usually in h1 or span with specific class
-        title_elem = soup.select_one(
+        title_elem = tree.css_first(
             "h1, span.text-xl.font-bold, h3.text-xl"
         )
-        title = title_elem.get_text(strip=True) if title_elem else "Unknown"
+        title = title_elem.text(strip=True) if title_elem else "Unknown"
 
         # Clean up title (remove "- Asura Scans" suffix etc)
-        title = re.sub(r"\s*[-–]\s*Asura\s*Scans?\s*$", "", title, flags=re.I)
+        title = _ASURA_SUFFIX_RE.sub("", title)
 
         # Description
-        desc_elem = soup.select_one(
+        desc_elem = tree.css_first(
             "span.font-medium.text-sm, .prose p, [class*='description']"
         )
-        description = desc_elem.get_text(strip=True) if desc_elem else None
+        description = desc_elem.text(strip=True) if desc_elem else None
 
         # Cover image
         cover_url = None
@@ -55,20 +76,30 @@ class AsuraScraper(BaseScraper):
             "img[src*='covers']",
         ]
         for selector in cover_selectors:
-            cover_elem = soup.select_one(selector)
+            cover_elem = tree.css_first(selector)
             if cover_elem:
-                cover_url = cover_elem.get("src")
+                cover_url = cover_elem.attributes.get("src")
                 if cover_url:
                     cover_url = self.absolute_url(cover_url)
                     break
 
+        # Status/Author/Artist labels - one document walk, first match per label
+        labels: dict[str, LexborNode] = {}
+        root = tree.root
+        # selectolax types root as optional; with no document there are no labels
+        if root is not None:
+            for node in root.traverse(include_text=True):
+                if node.is_text_node:
+                    for label in _LABEL_RE.findall(node.text_content or ""):
+                        labels.setdefault(label.lower(), node)
+
         # Status
         status = "unknown"
-        status_elem = soup.find(string=re.compile(r"Status", re.I))
+        status_elem = labels.get("status")
         if status_elem:
-            parent = status_elem.find_parent()
+            parent = status_elem.parent
             if parent:
-                status_text = parent.get_text(strip=True).lower()
+                status_text = parent.text(strip=True).lower()
                 if "ongoing" in status_text:
                     status = "ongoing"
                 elif "completed" in status_text or "complete" in status_text:
@@ -80,56 +111,57 @@ class AsuraScraper(BaseScraper):
 
         # Genres - look for buttons/badges
         genres = []
-        genre_elems = soup.select(
+        genre_elems = tree.css(
             "button[class*='genre'], a[href*='genre'], span[class*='badge']"
         )
         for elem in genre_elems:
-            genre = elem.get_text(strip=True)
+            genre = elem.text(strip=True)
             if genre and len(genre) < 50:  # Filter out non-genre text
                 genres.append(genre)
 
         # Authors/Artists
         authors = []
-        author_elem = soup.find(string=re.compile(r"Author", re.I))
+        author_elem = labels.get("author")
         if author_elem:
-            parent = author_elem.find_parent()
+            parent = author_elem.parent
             if parent:
                 # Look for the value in next sibling or child
-                for sibling in parent.find_next_siblings():
-                    text = sibling.get_text(strip=True)
+                for sibling in self._next_element_siblings(parent):
+                    text = sibling.text(strip=True)
                     if text and text != "Author":
                         authors.append(text)
                         break
 
         artists = []
-        artist_elem = soup.find(string=re.compile(r"Artist", re.I))
+        artist_elem = labels.get("artist")
         if artist_elem:
-            parent = artist_elem.find_parent()
+            parent = artist_elem.parent
             if parent:
-                for sibling in parent.find_next_siblings():
-                    text = sibling.get_text(strip=True)
+                for sibling in self._next_element_siblings(parent):
+                    text = sibling.text(strip=True)
                     if text and text != "Artist":
                         artists.append(text)
                         break
 
         # Chapters - Asura uses dynamic chapter list
         chapters = []
-        chapter_elems = soup.select(
+        seen_numbers: set[float] = set()
+        chapter_elems = tree.css(
             "a[href*='/chapter-'], div[class*='chapter'] a, h3 a[href*='chapter']"
         )
 
         for elem in chapter_elems:
-            ch_url = elem.get("href")
+            ch_url = elem.attributes.get("href")
             if not ch_url:
                 continue
 
             ch_url = self.absolute_url(ch_url)
-            ch_text = elem.get_text(strip=True)
+            ch_text = elem.text(strip=True)
 
             # Extract chapter number
             ch_num = None
             # Try URL first
-            match = re.search(r"chapter[/-](\d+(?:\.\d+)?)", ch_url, re.I)
+            match = _CHAPTER_NUM_RE.search(ch_url)
             if match:
                 ch_num = float(match.group(1))
             else:
@@ -140,8 +172,9 @@ class AsuraScraper(BaseScraper):
                 continue
 
             # Skip duplicates
-            if any(c["chapter_number"] == ch_num for c in chapters):
+            if ch_num in seen_numbers:
                 continue
+            seen_numbers.add(ch_num)
 
             chapters.append({
                 "chapter_number": ch_num,
@@ -181,36 +214,28 @@ class AsuraScraper(BaseScraper):
             force_browser=True,
             wait_selector="img[alt*='chapter'], img[src*='storage/media']",
         )
-        soup = self.parse_html(html)
+        tree = self.parse_html(html)
 
         images = []
 
-        # Asura typically uses img tags with storage URLs
-        img_selectors = [
-            "img[src*='storage/media']",
-            "img[alt*='chapter']",
-            ".w-full img[src*='asura']",
-            "img.max-w-full",
-        ]
-
-        img_elems = []
-        for selector in img_selectors:
-            img_elems = soup.select(selector)
-            if img_elems:
-                break
+        # Asura typically uses img tags with storage URLs. One walk over all
+        # candidates, then keep only the highest-priority group that matched.
+        candidates = tree.css(_IMAGE_SELECTOR)
+        ranked = [(self._image_priority(img), img) for img in candidates]
+        best = min((priority for priority, _ in ranked), default=None)
+        img_elems = [img for priority, img in ranked if priority == best]
 
         # Filter and deduplicate
         seen_urls = set()
         for img in img_elems:
-            img_url = img.get("src")
+            img_url = img.attributes.get("src")
 
             if not img_url:
                 continue
 
             # Skip non-chapter images
-            if any(skip in img_url.lower() for skip in [
-                "logo", "icon", "avatar", "banner", "ads", "placeholder"
-            ]):
+            lowered = img_url.lower()
+            if any(token in lowered for token in self.SKIP_TOKENS):
                 continue
 
             img_url = self.absolute_url(img_url.strip())
@@ -226,3 +251,11 @@ class AsuraScraper(BaseScraper):
             })
 
         return images
+
+    @staticmethod
+    def _image_priority(img: LexborNode) -> int:
+        """Index of the first chapter image selector this element matches."""
+        for priority, selector in enumerate(_IMAGE_SELECTORS):
+            if img.css_matches(selector):
+                return priority
+        return len(_IMAGE_SELECTORS)
@@ -1,21 +1,103 @@
 import asyncio
 import random
 import re
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from html import unescape
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from manga_scraper.config import settings
 from manga_scraper.core.logging import get_logger
 from manga_scraper.core.redis import get_redis
-from manga_scraper.scrapers.browser_pool import BrowserPool
+from manga_scraper.scrapers.browser_pool import get_browser_pool
+from manga_scraper.scrapers.http import get_shared_client
 
 logger = get_logger("scraper")
 
+# Compiled once at import; used on every response / chapter link
+_CLOUDFLARE_RE = re.compile(
+    rb"just a moment|checking your browser|cf-browser-verification"
+    rb"|challenge-platform|cloudflare|_cf_chl",
+    re.I,
+)
+_CLOUDFLARE_SCAN_BYTES = 64 * 1024
+# <img> tags and their quoted attributes, for scan_images
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.I)
+# Markup that a parser wouldn't render as <img> elements, dropped before the scan
+_SCAN_SKIP_RE = re.compile(r"<!--.*?-->|<(script|template)\b.*?</\1\s*>", re.I | re.S)
+_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+# Clearance id whose cookies each shared HTTP client already holds, per
+# domain. Entries vanish with their client.
+_loaded_clearances: "weakref.WeakKeyDictionary[httpx.AsyncClient, dict[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _ImageTarget:
+    """
+    lxml parser target that collects <img> attributes per scope as the
+    document streams past, without building a tree.
+    Scopes are ".class" or "#id"; an img is in a scope when it or an
+    enclosing element carries that class/id. Images inside <template>,
+    which libxml2 parses as ordinary markup, are skipped.
+    """
+
+    def __init__(self, scopes: Sequence[str]):
+        self._scopes = [(scope[0], scope[1:]) for scope in scopes]
+        self._open = [0] * len(scopes)  # enclosing elements per scope
+        self._stack: list[tuple[int, ...]] = []  # scopes each open element entered
+        self._images: list[list[dict[str, str]]] = [[] for _ in scopes]
+        self._templates = 0  # open <template> elements
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        entered: tuple[int, ...] = ()
+        if "class" in attrib or "id" in attrib:
+            classes = attrib.get("class", "").split()
+            element_id = attrib.get("id")
+            entered = tuple(
+                i
+                for i, (kind, name) in enumerate(self._scopes)
+                if (name in classes if kind == "." else name == element_id)
+            )
+            for i in entered:
+                self._open[i] += 1
+        self._stack.append(entered)
+
+        if tag == "template":
+            self._templates += 1
+        elif tag == "img" and not self._templates:
+            for i, depth in enumerate(self._open):
+                if depth:
+                    self._images[i].append(dict(attrib))
+
+    def end(self, tag: str) -> None:
+        if tag == "template" and self._templates:
+            self._templates -= 1
+        if self._stack:
+            for i in self._stack.pop():
+                self._open[i] -= 1
+
+    def close(self) -> list[dict[str, str]]:
+        # First scope that matched anything, like trying selectors in order
+        return next((images for images in self._images if images), [])
+
+
+class CloudflareBlockedError(Exception):
+    """Raised when Cloudflare blocks the request."""
+
+    pass
+
 
 class BaseScraper(ABC):
     """Base class for all site scrapers."""
@@ -24,31 +106,36 @@ class BaseScraper(ABC):
     SITE_NAME: str = "unknown"
     BASE_URL: str = ""
     REQUIRES_BROWSER: bool = False
+    # scan_images results below this count fall back to a parse
+    MIN_SCANNED_IMAGES: int = 3
+
+    # Derived from BASE_URL once per subclass
+    _domain: str = ""
+    _rate_key: str = "rate_bucket:"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._domain = urlparse(cls.BASE_URL).netloc
+        cls._rate_key = f"rate_bucket:{cls._domain}"
 
     def __init__(self, requires_browser: bool | None = None):
         self.requires_browser = (
             requires_browser if requires_browser is not None else self.REQUIRES_BROWSER
         )
         self.redis = get_redis()
-        self._http_client: httpx.AsyncClient | None = None
-        self._browser_pool: BrowserPool | None = None
+        self._headers = self._get_headers()
 
     async def get_http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers=self._get_headers(),
-            )
-        return self._http_client
+        """Get the loop's shared HTTP client (see scrapers.http)."""
+        return get_shared_client()
 
     async def close(self) -> None:
-        """Clean up resources."""
-        if self._http_client:
-            await self._http_client.aclose()
-        if self._browser_pool:
-            await self._browser_pool.close()
+        """
+        Clean up resources. The scraper can be reused afterwards.
+        The HTTP client and browser pool are shared per event loop and
+        closed by whoever owns the loop (close_shared_client /
+        close_browser_pool).
+        """
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers."""
@@ -68,31 +155,45 @@ class BaseScraper(ABC):
 
     async def _rate_limit(self) -> None:
         """Apply rate limiting."""
-        domain = urlparse(self.BASE_URL).netloc
-        limit = settings.get_rate_limit(domain)
-        key = f"rate:{domain}"
-
-        while not await self.redis.check_rate_limit(key, limit, window=60):
-            logger.debug("rate_limited", domain=domain)
-            await asyncio.sleep(1)
-
-        # Random delay for human-like behavior
-        delay = random.uniform(
-            settings.scraper_request_delay_min,
-            settings.scraper_request_delay_max,
-        )
+        limit = settings.get_rate_limit(self._domain)
+
+        # Sleep exactly until the next token; loop only if another worker took it
+        while True:
+            retry_ms, remaining = await self.redis.take_rate_limit_token(
+                self._rate_key, limit, window=60
+            )
+            if not retry_ms:
+                break
+            logger.debug("rate_limited", domain=self._domain, retry_ms=retry_ms)
+            await asyncio.sleep(retry_ms / 1000)
+
+        # Random delay for human-like behavior, only once the domain is busy
+        # enough to have drained half its bucket
+        if remaining > limit / 2:
+            return
+        delay_min = settings.scraper_request_delay_min
+        delay = delay_min + (settings.scraper_request_delay_max - delay_min) * random.random()
         await asyncio.sleep(delay)
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        # A challenge won't clear on retry; surface it so fetch_page can fall back
+        retry=retry_if_not_exception_type(CloudflareBlockedError),
+        reraise=True,
     )
-    async def _fetch_http(self, url: str) -> str:
-        """Fetch page content via HTTP."""
+    async def _fetch_http(self, url: str, user_agent: str | None = None) -> str:
+        """
+        Fetch page content via HTTP. user_agent overrides the default one,
+        for replaying a browser's clearance cookies.
+        """
         await self._rate_limit()
 
+        headers = self._headers
+        if user_agent:
+            headers = {**headers, "User-Agent": user_agent}
         client = await self.get_http_client()
-        response = await client.get(url)
+        response = await client.get(url, headers=headers)
 
         # Check for Cloudflare challenge
         if self._is_cloudflare_challenge(response):
@@ -102,14 +203,36 @@ class BaseScraper(ABC):
         response.raise_for_status()
         return response.text
 
-    async def _fetch_browser(self, url: str, wait_selector: str | None = None) -> str:
-        """Fetch page content via browser (for CF-protected sites)."""
-        await self._rate_limit()
+    async def _apply_stored_cookies(self, domain: str, clearance: str) -> None:
+        """
+        Merge cookies captured by the browser pool into the shared HTTP
+        client, once per clearance; the client's jar keeps them after that.
+        """
+        client = await self.get_http_client()
+        loaded = _loaded_clearances.setdefault(client, {})
+        if loaded.get(domain) == clearance:
+            return
+
+        for cookie in await self.redis.get_cookies(domain) or ():
+            client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain") or domain,
+                path=cookie.get("path") or "/",
+            )
+        loaded[domain] = clearance
 
-        if self._browser_pool is None:
-            self._browser_pool = BrowserPool()
+    async def _fetch_browser(
+        self, url: str, wait_selector: str | None = None, rate_limit: bool = True
+    ) -> str:
+        """
+        Fetch page content via browser (for CF-protected sites).
+        Pass rate_limit=False when this request already took its token.
+        """
+        if rate_limit:
+            await self._rate_limit()
 
-        return await self._browser_pool.fetch_page(url, wait_selector=wait_selector)
+        return await get_browser_pool().fetch_page(url, wait_selector=wait_selector)
 
     async def fetch_page(
         self,
@@ -120,37 +243,94 @@ class BaseScraper(ABC):
         """
         Fetch page content, using appropriate method.
         Tries HTTP first for speed, falls back to browser if blocked.
+        Browser-only sites go over HTTP too while a recent browser visit's
+        clearance cookies are still valid for the domain.
         """
-        if force_browser or self.requires_browser:
+        if force_browser:
             return await self._fetch_browser(url, wait_selector)
 
+        domain = urlparse(url).netloc
+        user_agent = None
+        if self.requires_browser:
+            clearance = await self.redis.get_cf_clearance(domain)
+            if clearance is None:
+                return await self._fetch_browser(url, wait_selector)
+            await self._apply_stored_cookies(domain, clearance["id"])
+            # The cookies are only good for the browser's UA
+            user_agent = clearance.get("user_agent")
+
         try:
-            return await self._fetch_http(url)
+            return await self._fetch_http(url, user_agent)
         except (CloudflareBlockedError, httpx.HTTPStatusError) as e:
             if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in (403, 503):
                 raise
 
+            if self.requires_browser:
+                await self.redis.clear_cf_cleared(domain)
             logger.info("falling_back_to_browser", url=url, reason=str(e))
-            return await self._fetch_browser(url, wait_selector)
+            # Same page request; the HTTP attempt already took the token
+            return await self._fetch_browser(url, wait_selector, rate_limit=False)
 
     def _is_cloudflare_challenge(self, response: httpx.Response) -> bool:
         """Detect Cloudflare challenge page."""
         if response.status_code in (403, 503):
-            text = response.text.lower()
-            indicators = [
-                "just a moment",
-                "checking your browser",
-                "cf-browser-verification",
-                "challenge-platform",
-                "cloudflare",
-                "_cf_chl",
-            ]
-            return any(ind in text for ind in indicators)
+            # One case-insensitive scan of the raw body; no decode or lower() copy.
+            # Challenge markers sit in the head of the page, so stop at 64 KB.
+            return _CLOUDFLARE_RE.search(response.content, 0, _CLOUDFLARE_SCAN_BYTES) is not None
         return False
 
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content."""
-        return BeautifulSoup(html, "lxml")
+    def parse_html(self, html: str, skip_tags: Sequence[str] = ()) -> LexborHTMLParser:
+        """
+        Parse HTML content with selectolax (C parser and CSS engine).
+        skip_tags are removed with their contents before the tree is
+        returned, so later walks don't visit them.
+        """
+        tree = LexborHTMLParser(html)
+        if skip_tags:
+            tree.strip_tags(list(skip_tags))
+        return tree
+
+    @staticmethod
+    def _next_element_siblings(node: LexborNode) -> Iterator[LexborNode]:
+        """Yield the element siblings after node (text nodes skipped)."""
+        sibling = node.next
+        while sibling is not None:
+            if sibling.is_element_node:
+                yield sibling
+            sibling = sibling.next
+
+    def collect_images(self, html: str, scopes: Sequence[str]) -> list[dict[str, str]]:
+        """
+        Attributes of the <img> tags in the first scope that has any, in
+        document order. One streaming pass; no DOM is built.
+        """
+        if not html:
+            return []
+        parser = etree.HTMLParser(target=_ImageTarget(scopes), encoding="utf-8", huge_tree=True)
+        # With a parser target, fromstring returns the target's close()
+        images: list[dict[str, str]] = etree.fromstring(html.encode(), parser)
+        return images
+
+    def scan_images(self, html: str, img_class: str) -> list[dict[str, str]]:
+        """
+        Attributes of the <img> tags carrying img_class, found by a regex
+        scan of the markup without parsing it. Comments, <script> and
+        <template> contents are skipped. Only quoted attribute values are
+        read, so callers should fall back to collect_images when this comes
+        up short.
+        """
+        images = []
+        for match in _IMG_TAG_RE.finditer(_SCAN_SKIP_RE.sub("", html)):
+            tag = match.group()
+            if img_class not in tag:
+                continue
+            attrs: dict[str, str] = {}
+            for name, double, single in _ATTR_RE.findall(tag):
+                # findall gives "" for the unused quote group
+                attrs.setdefault(name.lower(), unescape(double or single))
+            if img_class in attrs.get("class", "").split():
+                images.append(attrs)
+        return images
 
     def absolute_url(self, url: str, base: str | None = None) -> str:
         """Convert relative URL to absolute."""
@@ -161,14 +341,14 @@ class BaseScraper(ABC):
         """Extract chapter/volume number from text."""
         if not text:
             return None
-        match = re.search(r"(\d+(?:\.\d+)?)", text)
+        match = _NUMBER_RE.search(text)
         return float(match.group(1)) if match else None
 
     def slugify(self, text: str) -> str:
         """Convert text to URL-safe slug."""
         text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "-", text)
+        text = _SLUG_STRIP_RE.sub("", text)
+        text = _SLUG_DASH_RE.sub("-", text)
         return text[:200]
 
     @abstractmethod
@@ -218,9 +398,3 @@ class BaseScraper(ABC):
             ]
         """
         pass
-
-
-class CloudflareBlockedError(Exception):
-    """Raised when Cloudflare blocks the request."""
-
-    pass
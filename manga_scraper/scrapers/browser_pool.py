@@ -1,7 +1,9 @@
 import asyncio
+import time
+import weakref
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any
 
 from manga_scraper.config import settings
@@ -10,21 +12,29 @@ from manga_scraper.core.redis import get_redis
 
 logger = get_logger("browser_pool")
 
+# Title once the Cloudflare interstitial is gone, null while it is showing
+_CF_CLEARED_JS = """
+(title => title
+    && !title.toLowerCase().includes('just a moment')
+    && !document.querySelector('#challenge-running, .cf-browser-verification')
+    ? title : null)(document.title)
+"""
 
-@dataclass
+
+@dataclass(eq=False, slots=True)  # identity hash, so instances can live in a set
 class BrowserInstance:
     """Represents a browser instance in the pool."""
 
     browser: Any
     page: Any
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # time.monotonic() readings: cheap to take and immune to clock changes
+    created_at: float = field(default_factory=time.monotonic)
     request_count: int = 0
-    last_used: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    is_busy: bool = False
+    last_used: float = field(default_factory=time.monotonic)
 
     @property
     def age_seconds(self) -> float:
-        return (datetime.now(timezone.utc) - self.created_at).total_seconds()
+        return time.monotonic() - self.created_at
 
 
 class BrowserPool:
@@ -35,12 +45,28 @@ class BrowserPool:
 
     MAX_REQUESTS_PER_BROWSER = 50
     MAX_BROWSER_AGE_SECONDS = 1800  # 30 minutes
+    CF_CLEARANCE_TTL = 1800  # upper bound on trusting stored cookies over HTTP
     CF_WAIT_TIMEOUT = 15000  # 15 seconds for CF challenge
+    CF_RECHECK_SECONDS = 2.0  # re-check even without a load event
+
+    # Subresources we never read: only the HTML is scraped, and chapter image
+    # URLs come from src attributes, so the files themselves needn't load.
+    # Trailing * also matches query strings.
+    BLOCKED_URL_PATTERNS = [
+        "*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.avif*", "*.gif*", "*.svg*",
+        "*.woff*", "*.ttf*", "*.otf*",
+        "*.mp4*", "*.webm*", "*.mp3*",
+        "*.css*",
+    ]
 
     def __init__(self, pool_size: int | None = None):
         self.pool_size = pool_size or settings.scraper_concurrent_browsers
-        self._instances: list[BrowserInstance] = []
+        # Idle instances, most recently used on the left; checked-out ones in _busy
+        self._free: deque[BrowserInstance] = deque()
+        self._busy: set[BrowserInstance] = set()
         self._lock = asyncio.Lock()
+        # Signalled on release so waiters wake as soon as an instance frees up
+        self._available = asyncio.Condition(self._lock)
         self._redis = get_redis()
         self._initialized = False
 
@@ -62,9 +88,10 @@ class BrowserPool:
             )
 
             page = await browser.get("about:blank")
+            await self._block_heavy_resources(page)
 
             instance = BrowserInstance(browser=browser, page=page)
-            logger.info("browser_created", pool_size=len(self._instances) + 1)
+            logger.info("browser_created", pool_size=self.active_count + 1)
 
             return instance
 
@@ -72,6 +99,17 @@ class BrowserPool:
             logger.error("browser_create_failed", error=str(e))
             raise
 
+    async def _block_heavy_resources(self, page: Any) -> None:
+        """Have Chrome drop image/font/media/CSS requests for this tab."""
+        from nodriver import cdp
+
+        try:
+            await page.send(cdp.network.enable())
+            await page.send(cdp.network.set_blocked_ur_ls(urls=self.BLOCKED_URL_PATTERNS))
+        except Exception as e:
+            # Pages still work unfiltered, just heavier
+            logger.warning("browser_block_resources_failed", error=str(e))
+
     async def _destroy_browser(self, instance: BrowserInstance) -> None:
         """Destroy a browser instance."""
         try:
@@ -81,43 +119,49 @@ class BrowserPool:
         except Exception as e:
             logger.warning("browser_destroy_error", error=str(e))
 
+    def _is_retired(self, instance: BrowserInstance) -> bool:
+        """Whether the instance has served its requests or lived too long."""
+        return (
+            instance.request_count >= self.MAX_REQUESTS_PER_BROWSER
+            or instance.age_seconds >= self.MAX_BROWSER_AGE_SECONDS
+        )
+
     async def _get_instance(self) -> BrowserInstance:
         """Get an available browser instance from the pool."""
-        async with self._lock:
-            # Find available instance
-            for instance in self._instances:
-                if not instance.is_busy:
-                    # Check if instance needs replacement
-                    if (
-                        instance.request_count >= self.MAX_REQUESTS_PER_BROWSER
-                        or instance.age_seconds >= self.MAX_BROWSER_AGE_SECONDS
-                    ):
+        async with self._available:
+            while True:
+                # Take the warmest idle instance, replacing any that aged out
+                while self._free:
+                    instance = self._free.popleft()
+                    if self._is_retired(instance):
                         await self._destroy_browser(instance)
-                        self._instances.remove(instance)
                         continue
 
-                    instance.is_busy = True
+                    self._busy.add(instance)
                     return instance
 
-            # Create new instance if pool not full
-            if len(self._instances) < self.pool_size:
-                instance = await self._create_browser()
-                instance.is_busy = True
-                self._instances.append(instance)
-                return instance
-
-            # Wait for available instance
-            logger.debug("waiting_for_browser")
-            await asyncio.sleep(0.5)
+                # Create new instance if pool not full
+                if self.active_count < self.pool_size:
+                    instance = await self._create_browser()
+                    self._busy.add(instance)
+                    return instance
 
-        # Retry recursively
-        return await self._get_instance()
+                # Wait for an instance to be released
+                logger.debug("waiting_for_browser")
+                await self._available.wait()
 
     async def _release_instance(self, instance: BrowserInstance) -> None:
         """Release browser instance back to pool."""
-        instance.is_busy = False
-        instance.request_count += 1
-        instance.last_used = datetime.now(timezone.utc)
+        async with self._available:
+            self._busy.discard(instance)
+            instance.request_count += 1
+            instance.last_used = time.monotonic()
+            if self._is_retired(instance):
+                # Frees a slot; the woken waiter creates the replacement
+                await self._destroy_browser(instance)
+            else:
+                self._free.appendleft(instance)
+            self._available.notify()
 
     @asynccontextmanager
     async def acquire(self):
@@ -177,58 +221,87 @@ class BrowserPool:
                 raise
 
     async def _wait_for_cloudflare(self, page: Any, timeout: int) -> None:
-        """Wait for Cloudflare challenge to complete."""
-        import asyncio
-
-        start_time = asyncio.get_event_loop().time()
-        max_wait = timeout / 1000  # Convert to seconds
-
-        while (asyncio.get_event_loop().time() - start_time) < max_wait:
-            try:
-                # Check page title
-                title = await page.evaluate("document.title")
-
-                if title and "just a moment" not in title.lower():
-                    # Also check for challenge elements
-                    has_challenge = await page.evaluate(
-                        """
-                        () => {
-                            return document.querySelector('#challenge-running') !== null ||
-                                   document.querySelector('.cf-browser-verification') !== null;
-                        }
-                        """
-                    )
+        """
+        Wait for Cloudflare challenge to complete.
+        The challenge redirects once solved, so re-check on the page's load
+        event rather than polling; CF_RECHECK_SECONDS is only a safety net.
+        """
+        from nodriver import cdp
 
-                    if not has_challenge:
-                        logger.debug("cloudflare_resolved", title=title)
-                        return
+        loaded = asyncio.Event()
 
-            except Exception:
-                pass
+        def on_load(event: Any) -> None:
+            loaded.set()
 
-            await asyncio.sleep(0.5)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000  # timeout is in milliseconds
+        page.add_handler(cdp.page.LoadEventFired, on_load)
+        try:
+            while True:
+                loaded.clear()
+                title = await self._cleared_title(page)
+                if title:
+                    logger.debug("cloudflare_resolved", title=title)
+                    return
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        loaded.wait(), min(remaining, self.CF_RECHECK_SECONDS)
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            page.remove_handler(cdp.page.LoadEventFired, on_load)
 
         logger.warning("cloudflare_wait_timeout")
 
+    async def _cleared_title(self, page: Any) -> str | None:
+        """Page title if no challenge is showing, else None (one evaluate)."""
+        try:
+            title: str | None = await page.evaluate(_CF_CLEARED_JS)
+        except Exception:
+            return None
+        return title
+
     async def _store_cookies(self, url: str, page: Any) -> None:
         """Store browser cookies in Redis for HTTP requests."""
         try:
             from urllib.parse import urlparse
 
+            from nodriver import cdp
+
             domain = urlparse(url).netloc
-            cookies = await page.evaluate(
-                """
-                () => {
-                    return document.cookie.split(';').map(c => {
-                        const [name, value] = c.trim().split('=');
-                        return {name, value};
-                    });
+            # One CDP call; unlike document.cookie this includes HttpOnly
+            # cookies such as cf_clearance
+            cookies = [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": c.domain,
+                    "path": c.path,
+                    "expires": c.expires,
                 }
-                """
-            )
+                for c in await page.send(cdp.network.get_cookies(urls=[url]))
+            ]
 
             if cookies:
-                await self._redis.store_cookies(domain, cookies)
+                # Let HTTP try first for this domain until cf_clearance expires
+                ttl = self.CF_CLEARANCE_TTL
+                for cookie in cookies:
+                    if cookie["name"] == "cf_clearance" and cookie["expires"] > 0:
+                        ttl = min(ttl, int(cookie["expires"] - time.time()))
+
+                # cf_clearance is only honoured for the browser's own UA, so
+                # HTTP replays of these cookies must send the same one
+                user_agent = await page.evaluate("navigator.userAgent")
+
+                # Cookies and the clearance flag go out in one pipeline
+                await self._redis.store_cookies(
+                    domain, cookies, cf_ttl=ttl, user_agent=user_agent
+                )
                 logger.debug("cookies_stored", domain=domain, count=len(cookies))
 
         except Exception as e:
@@ -237,17 +310,41 @@ class BrowserPool:
     async def close(self) -> None:
         """Close all browser instances."""
         async with self._lock:
-            for instance in self._instances:
+            for instance in (*self._free, *self._busy):
                 await self._destroy_browser(instance)
-            self._instances.clear()
+            self._free.clear()
+            self._busy.clear()
             logger.info("browser_pool_closed")
 
     @property
     def active_count(self) -> int:
         """Number of active browser instances."""
-        return len(self._instances)
+        return len(self._free) + len(self._busy)
 
     @property
     def busy_count(self) -> int:
         """Number of busy browser instances."""
-        return sum(1 for i in self._instances if i.is_busy)
+        return len(self._busy)
+
+
+# One pool per event loop (browser connections are loop-bound), so
+# pool_size caps browsers across every scraper running on that loop.
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the browser pool shared by all scrapers on the running loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = BrowserPool()
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the running loop's browser pool. Call before the loop closes."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
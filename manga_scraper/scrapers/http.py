@@ -0,0 +1,35 @@
+import asyncio
+import weakref
+
+import httpx
+
+# httpx connections belong to the loop that opened them, so the shared
+# client is kept per event loop. Entries vanish when their loop is collected.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the HTTP/2 client shared by all scrapers on the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=_LIMITS,
+            timeout=_TIMEOUT,
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the running loop's shared client. Call before the loop closes."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
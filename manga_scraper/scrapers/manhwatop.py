@@ -1,10 +1,22 @@
+import asyncio
 import re
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
 from manga_scraper.scrapers.base import BaseScraper
 
+# Compiled once at import; used on every series page
+_ALT_TITLE_SPLIT_RE = re.compile(r"[,;/]")
+_SHOW_MORE_RE = re.compile(r"\s*(Show more|Show less|Read more).*$", re.I)
+_CHAPTER_NUM_RE = re.compile(r"chapter[/-](\d+(?:\.\d+)?)", re.I)
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_DATE_FORMATS = ("%Y-%m-%d", "%B %d, %Y", "%d/%m/%Y")
+# Placeholders and non-content images, one scan per image src
+_SKIP_IMAGE_RE = re.compile(r"placeholder|loading|spinner|logo|icon|avatar|banner", re.I)
+
 
 class ManhwatopScraper(BaseScraper):
     """
@@ -16,13 +28,25 @@ class ManhwatopScraper(BaseScraper):
     BASE_URL = "https://manhwatop.com"
     REQUIRES_BROWSER = True
 
+    # Class the Madara theme puts on every chapter page image
+    CHAPTER_IMG_CLASS = "wp-manga-chapter-img"
+
+    # Chapter image scopes, most specific first (see BaseScraper.collect_images)
+    IMAGE_SCOPES = (
+        ".reading-content",
+        ".chapter-content",
+        ".page-break",
+        "#manga-reading",
+        ".wp-manga-chapter-img",
+    )
+
     async def scrape_series(self, url: str) -> dict[str, Any]:
         """Scrape series metadata and chapter list."""
         html = await self.fetch_page(
             url,
             wait_selector=".post-title h1, .manga-title",
         )
-        soup = self.parse_html(html)
+        tree = self.parse_html(html)
 
         # Extract source ID from URL
         parsed = urlparse(url)
@@ -30,50 +54,47 @@ class ManhwatopScraper(BaseScraper):
         source_id = path_parts[-1] if len(path_parts) > 1 else ""
 
         # Title
-        title_elem = soup.select_one(
+        title_elem = tree.css_first(
             ".post-title h1, .manga-title, h1.entry-title"
         )
-        title = title_elem.get_text(strip=True) if title_elem else "Unknown"
+        title = title_elem.text(strip=True) if title_elem else "Unknown"
 
         # Alternative titles
         title_alt = None
-        alt_elem = soup.select_one(".alternative, .other-name, .alt-name")
+        alt_elem = tree.css_first(".alternative, .other-name, .alt-name")
         if alt_elem:
-            alt_text = alt_elem.get_text(strip=True)
+            alt_text = alt_elem.text(strip=True)
             if alt_text:
-                title_alt = [t.strip() for t in re.split(r"[,;/]", alt_text) if t.strip()]
+                title_alt = [t.strip() for t in _ALT_TITLE_SPLIT_RE.split(alt_text) if t.strip()]
 
         # Description
-        desc_elem = soup.select_one(
+        desc_elem = tree.css_first(
             ".description-summary .summary__content, .manga-excerpt, .summary p"
         )
         description = None
         if desc_elem:
-            description = desc_elem.get_text(strip=True)
+            description = desc_elem.text(strip=True)
             # Clean up "Show more" type text
-            description = re.sub(r"\s*(Show more|Show less|Read more).*$", "", description, flags=re.I)
+            description = _SHOW_MORE_RE.sub("", description)
 
         # Cover image
         cover_url = None
-        cover_elem = soup.select_one(
+        cover_elem = tree.css_first(
             ".summary_image img, .manga-poster img, .thumb img"
         )
         if cover_elem:
-            cover_url = (
-                cover_elem.get("data-src")
-                or cover_elem.get("data-lazy-src")
-                or cover_elem.get("src")
-            )
+            attrs = cover_elem.attributes
+            cover_url = attrs.get("data-src") or attrs.get("data-lazy-src") or attrs.get("src")
             if cover_url:
                 cover_url = self.absolute_url(cover_url)
 
         # Status
         status = "unknown"
-        status_elem = soup.select_one(
+        status_elem = tree.css_first(
             ".post-status .summary-content, .manga-status"
         )
         if status_elem:
-            status_text = status_elem.get_text(strip=True).lower()
+            status_text = status_elem.text(strip=True).lower()
             if "ongoing" in status_text:
                 status = "ongoing"
             elif "completed" in status_text or "complete" in status_text:
@@ -85,80 +106,31 @@ class ManhwatopScraper(BaseScraper):
 
         # Genres
         genres = []
-        genre_elems = soup.select(".genres-content a, .manga-genres a, .wp-manga-genre a")
+        genre_elems = tree.css(".genres-content a, .manga-genres a, .wp-manga-genre a")
         for elem in genre_elems:
-            genre = elem.get_text(strip=True)
+            genre = elem.text(strip=True)
             if genre:
                 genres.append(genre)
 
         # Authors
         authors = []
-        author_elems = soup.select(".author-content a, .manga-authors a")
+        author_elems = tree.css(".author-content a, .manga-authors a")
         for elem in author_elems:
-            name = elem.get_text(strip=True)
+            name = elem.text(strip=True)
             if name and name.lower() != "updating":
                 authors.append(name)
 
         # Artists
         artists = []
-        artist_elems = soup.select(".artist-content a, .manga-artists a")
+        artist_elems = tree.css(".artist-content a, .manga-artists a")
         for elem in artist_elems:
-            name = elem.get_text(strip=True)
+            name = elem.text(strip=True)
             if name and name.lower() != "updating":
                 artists.append(name)
 
-        # Chapters
-        chapters = []
-        chapter_elems = soup.select(
-            ".wp-manga-chapter a, li.chapter a, .chapter-item a"
-        )
-
-        for elem in chapter_elems:
-            ch_url = elem.get("href")
-            if not ch_url:
-                continue
-
-            ch_url = self.absolute_url(ch_url)
-            ch_text = elem.get_text(strip=True)
-
-            # Extract chapter number
-            ch_num = None
-            match = re.search(r"chapter[/-](\d+(?:\.\d+)?)", ch_url, re.I)
-            if match:
-                ch_num = float(match.group(1))
-            else:
-                ch_num = self.extract_number(ch_text)
-
-            if ch_num is None:
-                continue
-
-            # Skip duplicates
-            if any(c["chapter_number"] == ch_num for c in chapters):
-                continue
-
-            # Try to get release date
-            release_date = None
-            date_elem = elem.find_parent("li")
-            if date_elem:
-                date_span = date_elem.select_one(".chapter-release-date, .release-date, time")
-                if date_span:
-                    date_text = date_span.get("datetime") or date_span.get_text(strip=True)
-                    if date_text:
-                        for fmt in ["%Y-%m-%d", "%B %d, %Y", "%d/%m/%Y"]:
-                            try:
-                                release_date = datetime.strptime(date_text[:10], fmt)
-                                break
-                            except ValueError:
-                                continue
-
-            chapters.append({
-                "chapter_number": ch_num,
-                "source_url": ch_url,
-                "title": ch_text if "chapter" not in ch_text.lower() else None,
-                "release_date": release_date,
-            })
-
-        chapters.sort(key=lambda x: x["chapter_number"])
+        # Chapters - the per-row loop is the bulk of the CPU work on long
+        # series, so run it off the event loop
+        chapters = await asyncio.to_thread(self._parse_chapters, tree)
 
         return {
             "source_site": self.SITE_NAME,
@@ -188,40 +160,24 @@ class ManhwatopScraper(BaseScraper):
             force_browser=True,
             wait_selector=".reading-content img, .chapter-content img",
         )
-        soup = self.parse_html(html)
 
         images = []
 
-        # Try multiple selectors
-        img_selectors = [
-            ".reading-content img",
-            ".chapter-content img",
-            ".page-break img",
-            "#manga-reading img",
-            ".wp-manga-chapter-img",
-        ]
-
-        img_elems = []
-        for selector in img_selectors:
-            img_elems = soup.select(selector)
-            if img_elems:
-                break
+        # Theme-marked page images straight from the markup; if too few turn
+        # up, walk the image containers, first one present wins
+        img_elems = self.scan_images(html, self.CHAPTER_IMG_CLASS)
+        if len(img_elems) < self.MIN_SCANNED_IMAGES:
+            img_elems = self.collect_images(html, self.IMAGE_SCOPES)
 
         seen_urls = set()
-        for img in img_elems:
-            img_url = (
-                img.get("data-src")
-                or img.get("data-lazy-src")
-                or img.get("src")
-            )
+        for attrs in img_elems:
+            img_url = attrs.get("data-src") or attrs.get("data-lazy-src") or attrs.get("src")
 
             if not img_url:
                 continue
 
             # Skip placeholders and non-content images
-            if any(skip in img_url.lower() for skip in [
-                "placeholder", "loading", "spinner", "logo", "icon", "avatar", "banner"
-            ]):
+            if _SKIP_IMAGE_RE.search(img_url):
                 continue
 
             img_url = self.absolute_url(img_url.strip())
@@ -236,3 +192,90 @@ class ManhwatopScraper(BaseScraper):
             })
 
         return images
+
+    def _parse_chapters(self, tree: LexborHTMLParser) -> list[dict[str, Any]]:
+        """Chapter list from a parsed series page, sorted by number."""
+        chapters = []
+        seen_numbers: set[float] = set()
+        chapter_elems = tree.css(
+            ".wp-manga-chapter a, li.chapter a, .chapter-item a"
+        )
+
+        # Release dates: one query for the page keyed by their <li> row,
+        # rather than a css_first inside every chapter row
+        row_dates: dict[int, LexborNode] = {}
+        for span in tree.css(".chapter-release-date, .release-date, time"):
+            row = self._find_parent(span, "li")
+            if row is not None:
+                row_dates.setdefault(row.mem_id, span)
+
+        for elem in chapter_elems:
+            ch_url = elem.attributes.get("href")
+            if not ch_url:
+                continue
+
+            ch_url = self.absolute_url(ch_url)
+            ch_text = elem.text(strip=True)
+
+            # Extract chapter number
+            ch_num = None
+            match = _CHAPTER_NUM_RE.search(ch_url)
+            if match:
+                ch_num = float(match.group(1))
+            else:
+                ch_num = self.extract_number(ch_text)
+
+            if ch_num is None:
+                continue
+
+            # Skip duplicates
+            if ch_num in seen_numbers:
+                continue
+            seen_numbers.add(ch_num)
+
+            # Try to get release date
+            release_date = None
+            row = self._find_parent(elem, "li")
+            date_span = row_dates.get(row.mem_id) if row is not None else None
+            if date_span:
+                date_text = date_span.attributes.get("datetime") or date_span.text(strip=True)
+                if date_text:
+                    release_date = self._parse_date(date_text[:10])
+
+            chapters.append({
+                "chapter_number": ch_num,
+                "source_url": ch_url,
+                "title": ch_text if "chapter" not in ch_text.lower() else None,
+                "release_date": release_date,
+            })
+
+        chapters.sort(key=lambda x: x["chapter_number"])
+
+        return chapters
+
+    @staticmethod
+    def _parse_date(text: str) -> datetime | None:
+        """Parse a release date; plain ISO dates skip strptime."""
+        match = _ISO_DATE_RE.fullmatch(text)
+        if match:
+            try:
+                year, month, day = map(int, match.groups())
+                return datetime(year, month, day)
+            except ValueError:
+                pass
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        return None
+
+    @staticmethod
+    def _find_parent(node: LexborNode, tag: str) -> LexborNode | None:
+        """Nearest ancestor of node with the given tag name."""
+        parent = node.parent
+        while parent is not None:
+            if parent.tag == tag:
+                return parent
+            parent = parent.parent
+        return None
@@ -5,6 +5,10 @@ from urllib.parse import urlparse
 
 from manga_scraper.scrapers.base import BaseScraper
 
+# Compiled once at import; used on every chapter link
+_CHAPTER_NUM_RE = re.compile(r"chapter[/-](\d+(?:\.\d+)?)", re.I)
+_DATE_FORMATS = ("%B %d, %Y", "%Y-%m-%d", "%d/%m/%Y")
+
 
 class MgekoScraper(BaseScraper):
     """Scraper for mgeko.cc - No Cloudflare protection."""
@@ -13,10 +17,22 @@ class MgekoScraper(BaseScraper):
     BASE_URL = "https://www.mgeko.cc"
     REQUIRES_BROWSER = False  # Plain HTTP works
 
+    # Class the Madara theme puts on every chapter page image
+    CHAPTER_IMG_CLASS = "wp-manga-chapter-img"
+
+    # Chapter image scopes, most specific first (see BaseScraper.collect_images)
+    IMAGE_SCOPES = (
+        ".reading-content",
+        ".chapter-content",
+        ".page-break",
+        "#manga-reading-nav-body",
+        ".wp-manga-chapter-img",
+    )
+
     async def scrape_series(self, url: str) -> dict[str, Any]:
         """Scrape series metadata and chapter list."""
         html = await self.fetch_page(url)
-        soup = self.parse_html(html)
+        tree = self.parse_html(html)
 
         # Extract source ID from URL
         parsed = urlparse(url)
@@ -24,33 +40,33 @@ class MgekoScraper(BaseScraper):
         source_id = path_parts[-1] if path_parts else ""
 
         # Title
-        title_elem = soup.select_one("h1.entry-title, .post-title h1, h1")
-        title = title_elem.get_text(strip=True) if title_elem else "Unknown"
+        title_elem = tree.css_first("h1.entry-title, .post-title h1, h1")
+        title = title_elem.text(strip=True) if title_elem else "Unknown"
 
         # Alternative titles
-        alt_title_elem = soup.select_one(".alternative-title, .other-name")
+        alt_title_elem = tree.css_first(".alternative-title, .other-name")
         title_alt = None
         if alt_title_elem:
-            alt_text = alt_title_elem.get_text(strip=True)
+            alt_text = alt_title_elem.text(strip=True)
             title_alt = [t.strip() for t in alt_text.split(",") if t.strip()]
 
         # Description
-        desc_elem = soup.select_one(".summary__content, .description-summary, .manga-excerpt")
-        description = desc_elem.get_text(strip=True) if desc_elem else None
+        desc_elem = tree.css_first(".summary__content, .description-summary, .manga-excerpt")
+        description = desc_elem.text(strip=True) if desc_elem else None
 
         # Cover image
-        cover_elem = soup.select_one(".summary_image img, .thumb img, .manga-poster img")
+        cover_elem = tree.css_first(".summary_image img, .thumb img, .manga-poster img")
         cover_url = None
         if cover_elem:
-            cover_url = cover_elem.get("data-src") or cover_elem.get("src")
+            cover_url = cover_elem.attributes.get("data-src") or cover_elem.attributes.get("src")
             if cover_url:
                 cover_url = self.absolute_url(cover_url)
 
         # Status
         status = "unknown"
-        status_elem = soup.select_one(".post-status .summary-content, .status")
+        status_elem = tree.css_first(".post-status .summary-content, .status")
         if status_elem:
-            status_text = status_elem.get_text(strip=True).lower()
+            status_text = status_elem.text(strip=True).lower()
             if "ongoing" in status_text:
                 status = "ongoing"
             elif "completed" in status_text or "complete" in status_text:
@@ -60,44 +76,44 @@ class MgekoScraper(BaseScraper):
 
         # Genres
         genres = []
-        genre_elems = soup.select(".genres-content a, .manga-genres a, .tags a")
+        genre_elems = tree.css(".genres-content a, .manga-genres a, .tags a")
         for elem in genre_elems:
-            genre = elem.get_text(strip=True)
+            genre = elem.text(strip=True)
             if genre:
                 genres.append(genre)
 
         # Authors/Artists
         authors = []
         artists = []
-        author_elems = soup.select(".author-content a, .manga-authors a")
+        author_elems = tree.css(".author-content a, .manga-authors a")
         for elem in author_elems:
-            name = elem.get_text(strip=True)
+            name = elem.text(strip=True)
             if name:
                 authors.append(name)
 
-        artist_elems = soup.select(".artist-content a, .manga-artists a")
+        artist_elems = tree.css(".artist-content a, .manga-artists a")
         for elem in artist_elems:
-            name = elem.get_text(strip=True)
+            name = elem.text(strip=True)
             if name:
                 artists.append(name)
 
         # Chapters
         chapters = []
-        chapter_elems = soup.select(".wp-manga-chapter a, .chapter-list a, li.chapter a")
+        chapter_elems = tree.css(".wp-manga-chapter a, .chapter-list a, li.chapter a")
 
         for elem in chapter_elems:
-            ch_url = elem.get("href")
+            ch_url = elem.attributes.get("href")
             if not ch_url:
                 continue
 
             ch_url = self.absolute_url(ch_url)
-            ch_text = elem.get_text(strip=True)
+            ch_text = elem.text(strip=True)
 
             # Extract chapter number
             ch_num = self.extract_number(ch_text)
             if ch_num is None:
                 # Try from URL
-                match = re.search(r"chapter[/-](\d+(?:\.\d+)?)", ch_url, re.I)
+                match = _CHAPTER_NUM_RE.search(ch_url)
                 if match:
                     ch_num = float(match.group(1))
                 else:
@@ -105,12 +121,19 @@ class MgekoScraper(BaseScraper):
 
             # Release date
             release_date = None
-            date_elem = elem.find_next_sibling(class_="chapter-release-date")
+            date_elem = next(
+                (
+                    sibling
+                    for sibling in self._next_element_siblings(elem)
+                    if "chapter-release-date" in (sibling.attributes.get("class") or "").split()
+                ),
+                None,
+            )
             if date_elem:
                 try:
-                    date_text = date_elem.get_text(strip=True)
+                    date_text = date_elem.text(strip=True)
                     # Parse various date formats
-                    for fmt in ["%B %d, %Y", "%Y-%m-%d", "%d/%m/%Y"]:
+                    for fmt in _DATE_FORMATS:
                         try:
                             release_date = datetime.strptime(date_text, fmt)
                             break
@@ -152,31 +175,20 @@ class MgekoScraper(BaseScraper):
     ) -> list[dict[str, Any]]:
         """Scrape chapter images."""
         html = await self.fetch_page(url, force_browser=force_browser)
-        soup = self.parse_html(html)
 
         images = []
 
-        # Try different selectors for images
-        img_selectors = [
-            ".reading-content img",
-            ".chapter-content img",
-            ".page-break img",
-            "#manga-reading-nav-body img",
-            ".wp-manga-chapter-img",
-        ]
-
-        img_elems = []
-        for selector in img_selectors:
-            img_elems = soup.select(selector)
-            if img_elems:
-                break
-
-        for idx, img in enumerate(img_elems, 1):
+        # Regex fast path for the theme's page images, else one container walk
+        img_elems = self.scan_images(html, self.CHAPTER_IMG_CLASS)
+        if len(img_elems) < self.MIN_SCANNED_IMAGES:
+            img_elems = self.collect_images(html, self.IMAGE_SCOPES)
+
+        for idx, attrs in enumerate(img_elems, 1):
             # Get image URL (check data-src first for lazy loading)
             img_url = (
-                img.get("data-src")
-                or img.get("data-lazy-src")
-                or img.get("src")
+                attrs.get("data-src")
+                or attrs.get("data-lazy-src")
+                or attrs.get("src")
             )
 
             if not img_url:
@@ -1,3 +1,3 @@
-from manga_scraper.storage.s3 import ImageStorage
+from manga_scraper.storage.s3 import ImageStorage, close_storage, get_storage
 
-__all__ = ["ImageStorage"]
+__all__ = ["ImageStorage", "close_storage", "get_storage"]
@@ -1,25 +1,56 @@
+import asyncio
+import base64
 import hashlib
 import mimetypes
+import weakref
+from collections.abc import Sequence
 from io import BytesIO
 from typing import Any
 
 import aioboto3
 import httpx
+from boto3.s3.transfer import TransferConfig
 from PIL import Image
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from manga_scraper.config import settings
 from manga_scraper.core.logging import get_logger
+from manga_scraper.core.redis import get_redis
 
 logger = get_logger("storage")
 
+# How long a source image's digest points at its stored object
+IMAGE_INDEX_TTL = 30 * 86400
+
+# Pages above this go up as concurrent multipart parts instead of one PUT
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=4,
+)
+_CACHE_CONTROL = "public, max-age=31536000"  # 1 year cache
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Network errors, 429 and 5xx are worth another download attempt."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
 
 class ImageStorage:
     """S3/MinIO image storage handler."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.session = aioboto3.Session()
         self._http_client: httpx.AsyncClient | None = None
+        # One S3 client for the storage's lifetime, so credentials, endpoint
+        # setup and keep-alive connections carry over between calls
+        self._s3_cm: Any = None
+        self._s3: Any = None
+        self._s3_lock = asyncio.Lock()  # concurrent first calls open one client
 
     async def get_http_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
@@ -34,9 +65,23 @@ class ImageStorage:
             )
         return self._http_client
 
+    async def _get_s3(self) -> Any:
+        """Get the storage's S3 client, opening it on first use."""
+        if self._s3 is None:
+            async with self._s3_lock:
+                if self._s3 is None:
+                    s3_cm = self.session.client(**self._get_s3_config())
+                    self._s3 = await s3_cm.__aenter__()
+                    self._s3_cm = s3_cm
+        return self._s3
+
     async def close(self) -> None:
         if self._http_client:
             await self._http_client.aclose()
+            self._http_client = None
+        if self._s3_cm is not None:
+            s3_cm, self._s3_cm, self._s3 = self._s3_cm, None, None
+            await s3_cm.__aexit__(None, None, None)
 
     def _get_s3_config(self) -> dict[str, Any]:
         """Get S3 client configuration."""
@@ -50,10 +95,6 @@ class ImageStorage:
             config["endpoint_url"] = settings.s3_endpoint_url
         return config
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def download_and_store(
         self,
         source_url: str,
@@ -73,48 +114,70 @@ class ImageStorage:
                 "content_type": str,
             }
         """
-        client = await self.get_http_client()
-
-        # Download image
-        response = await client.get(source_url)
-        response.raise_for_status()
+        # A retried batch may already have stored this page; optimized pages
+        # have a known key, so one HEAD can save the download and re-encode.
+        # A page stored raw after a failed encode isn't found here; it is
+        # downloaded again and its PUT overwrites the earlier copy.
+        if optimize:
+            path = self._page_path(series_id, chapter_id, page_number, "image/webp")
+            existing = await self._head_stored(path)
+            if existing:
+                return existing
 
+        response = await self._download(source_url)
         content = response.content
         content_type = response.headers.get("content-type", "image/jpeg")
+        del response  # content is the only copy of the body we keep
 
-        # Detect actual content type from image
-        try:
-            img = Image.open(BytesIO(content))
-            fmt = img.format or "JPEG"
-            content_type = f"image/{fmt.lower()}"
-
-            # Optimize if requested
-            if optimize:
-                content, content_type = self._optimize_image(img)
+        # Sites reuse filler/credit pages across chapters. If these exact
+        # bytes were stored before, copy that object server-side instead of
+        # re-encoding and re-uploading it. A copy rather than a shared key,
+        # so deleting one chapter's prefix never breaks another chapter.
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        stored = await self._lookup_stored(
+            f"image_hash:{digest}:{'webp' if optimize else 'raw'}"
+        )
+        if stored:
+            result = await self._copy_stored(stored, series_id, chapter_id, page_number)
+            if result:
+                return result
 
+        # Detect actual content type and optimize off the event loop; Pillow
+        # drops the GIL while resizing and encoding, so downloads in flight
+        # keep moving and several images encode on separate cores.
+        encoded = optimize
+        try:
+            content, content_type = await asyncio.to_thread(
+                self._process_image, content, optimize
+            )
         except Exception as e:
             logger.warning("image_process_failed", url=source_url, error=str(e))
+            encoded = False  # the source bytes go up as downloaded
 
         # Generate storage path
-        ext = mimetypes.guess_extension(content_type) or ".jpg"
-        path = f"series/{series_id}/chapters/{chapter_id}/{page_number:04d}{ext}"
+        path = self._page_path(series_id, chapter_id, page_number, content_type)
 
         # Upload to S3
-        async with self.session.client(**self._get_s3_config()) as s3:
+        s3 = await self._get_s3()
+        if len(content) > MULTIPART_THRESHOLD:
+            await s3.upload_fileobj(
+                BytesIO(content),
+                settings.s3_bucket_name,
+                path,
+                ExtraArgs={"ContentType": content_type, "CacheControl": _CACHE_CONTROL},
+                Config=_TRANSFER_CONFIG,
+            )
+        else:
             await s3.put_object(
                 Bucket=settings.s3_bucket_name,
                 Key=path,
                 Body=content,
                 ContentType=content_type,
-                CacheControl="public, max-age=31536000",  # 1 year cache
+                CacheControl=_CACHE_CONTROL,
+                # S3 rejects the PUT if the body arrived corrupted
+                ContentMD5=base64.b64encode(hashlib.md5(content).digest()).decode(),
             )
 
-        # Generate URL
-        if settings.s3_endpoint_url:
-            url = f"{settings.s3_endpoint_url}/{settings.s3_bucket_name}/{path}"
-        else:
-            url = f"https://{settings.s3_bucket_name}.s3.{settings.s3_region}.amazonaws.com/{path}"
-
         logger.debug(
             "image_stored",
             path=path,
@@ -122,24 +185,138 @@ class ImageStorage:
             content_type=content_type,
         )
 
-        return {
+        result = {
             "path": path,
-            "url": url,
+            "url": self._public_url(path),
             "size": len(content),
             "content_type": content_type,
         }
+        # Index what was actually stored: a fallback upload is the raw
+        # bytes, which a later optimized page must not copy as its WebP
+        await self._remember_stored(
+            f"image_hash:{digest}:{'webp' if encoded else 'raw'}", result
+        )
+        return result
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        # Only the download is retried: a 404 or an S3 error won't fix itself
+        retry=retry_if_exception(_is_transient),
+        reraise=True,
+    )
+    async def _download(self, source_url: str) -> httpx.Response:
+        """Download a source image."""
+        client = await self.get_http_client()
+        response = await client.get(source_url)
+        response.raise_for_status()
+        return response
+
+    def _page_path(
+        self,
+        series_id: int,
+        chapter_id: int,
+        page_number: int,
+        content_type: str,
+    ) -> str:
+        """S3 key of a chapter page."""
+        ext = mimetypes.guess_extension(content_type) or ".jpg"
+        return f"series/{series_id}/chapters/{chapter_id}/{page_number:04d}{ext}"
+
+    async def _head_stored(self, path: str) -> dict[str, Any] | None:
+        """Stored object at path, or None if there isn't one."""
+        s3 = await self._get_s3()
+        try:
+            head = await s3.head_object(Bucket=settings.s3_bucket_name, Key=path)
+        except Exception:
+            # 404, or S3 trouble the upload below will surface
+            return None
+
+        logger.debug("image_already_stored", path=path)
+        return {
+            "path": path,
+            "url": self._public_url(path),
+            "size": head["ContentLength"],
+            "content_type": head["ContentType"],
+        }
+
+    def _public_url(self, path: str) -> str:
+        """Public URL of a stored object."""
+        if settings.s3_endpoint_url:
+            return f"{settings.s3_endpoint_url}/{settings.s3_bucket_name}/{path}"
+        return f"https://{settings.s3_bucket_name}.s3.{settings.s3_region}.amazonaws.com/{path}"
+
+    async def _lookup_stored(self, index_key: str) -> dict[str, Any] | None:
+        """Stored object for a source digest, if any. Redis errors count as a miss."""
+        try:
+            return await get_redis().get_cached(index_key)
+        except Exception as e:
+            logger.warning("image_index_lookup_failed", error=str(e))
+            return None
+
+    async def _remember_stored(self, index_key: str, result: dict[str, Any]) -> None:
+        """Point a source digest at the object just uploaded."""
+        try:
+            await get_redis().set_cached(index_key, result, ttl=IMAGE_INDEX_TTL)
+        except Exception as e:
+            logger.warning("image_index_store_failed", error=str(e))
+
+    async def _copy_stored(
+        self,
+        stored: dict[str, Any],
+        series_id: int,
+        chapter_id: int,
+        page_number: int,
+    ) -> dict[str, Any] | None:
+        """
+        Copy a previously stored image to this page's key (S3 keeps its
+        content type and cache headers). None if the source is gone.
+        """
+        path = self._page_path(series_id, chapter_id, page_number, stored["content_type"])
+
+        if path != stored["path"]:
+            s3 = await self._get_s3()
+            try:
+                await s3.copy_object(
+                    Bucket=settings.s3_bucket_name,
+                    Key=path,
+                    CopySource={"Bucket": settings.s3_bucket_name, "Key": stored["path"]},
+                )
+            except Exception as e:
+                logger.debug("image_copy_failed", source=stored["path"], error=str(e))
+                return None
+
+        logger.debug("image_deduplicated", path=path, source=stored["path"])
+        return {**stored, "path": path, "url": self._public_url(path)}
+
+    def _process_image(self, content: bytes, optimize: bool) -> tuple[bytes, str]:
+        """
+        Detect the image's real type and optionally re-encode it (blocking).
+        BytesIO shares content's buffer, and closing the image frees its
+        decoded pixels before the upload rather than when the task returns.
+        """
+        with Image.open(BytesIO(content)) as img:
+            fmt = img.format or "JPEG"
+            if optimize:
+                return self._optimize_image(img)
+            return content, f"image/{fmt.lower()}"
 
     def _optimize_image(
         self,
         img: Image.Image,
         max_width: int = 1200,
         quality: int = 85,
+        method: int = 2,
     ) -> tuple[bytes, str]:
         """
         Optimize image for storage.
         - Convert to WebP for better compression
         - Resize if too large
         - Strip metadata
+
+        method is libwebp's effort level (0-6). On a 1200x6000 page, 2 encodes
+        about 2.3x faster than 4 for ~3% larger files; 0 is faster still but
+        ~25% larger, which costs more in storage and egress than it saves.
         """
         # Convert to RGB if necessary (for PNG with transparency)
         if img.mode in ("RGBA", "P"):
@@ -159,73 +336,100 @@ class ImageStorage:
 
         # Save as WebP
         buffer = BytesIO()
-        img.save(buffer, format="WEBP", quality=quality, method=4)
-        buffer.seek(0)
+        img.save(buffer, format="WEBP", quality=quality, method=method)
 
-        return buffer.read(), "image/webp"
+        return buffer.getvalue(), "image/webp"
 
     async def delete_image(self, path: str) -> None:
         """Delete image from S3."""
-        async with self.session.client(**self._get_s3_config()) as s3:
-            await s3.delete_object(
+        s3 = await self._get_s3()
+        await s3.delete_object(
+            Bucket=settings.s3_bucket_name,
+            Key=path,
+        )
+
+    async def delete_objects(self, paths: Sequence[str]) -> int:
+        """
+        Delete objects by key, up to 1000 per request. Callers pass the keys
+        recorded in the database, so no LIST calls are needed. Returns the
+        number deleted; keys S3 reports as failed are logged.
+        """
+        s3 = await self._get_s3()
+        failed = 0
+        for start in range(0, len(paths), 1000):
+            # Quiet mode still reports the keys that couldn't be deleted
+            resp = await s3.delete_objects(
                 Bucket=settings.s3_bucket_name,
-                Key=path,
+                Delete={
+                    "Objects": [{"Key": path} for path in paths[start:start + 1000]],
+                    "Quiet": True,
+                },
             )
+            for error in resp.get("Errors", []):
+                logger.warning(
+                    "image_delete_failed",
+                    key=error.get("Key"),
+                    code=error.get("Code"),
+                    error=error.get("Message"),
+                )
+                failed += 1
 
-    async def delete_chapter_images(self, series_id: int, chapter_id: int) -> int:
-        """Delete all images for a chapter."""
-        prefix = f"series/{series_id}/chapters/{chapter_id}/"
-        deleted = 0
-
-        async with self.session.client(**self._get_s3_config()) as s3:
-            paginator = s3.get_paginator("list_objects_v2")
-            async for page in paginator.paginate(
-                Bucket=settings.s3_bucket_name,
-                Prefix=prefix,
-            ):
-                if "Contents" not in page:
-                    continue
-
-                objects = [{"Key": obj["Key"]} for obj in page["Contents"]]
-                if objects:
-                    await s3.delete_objects(
-                        Bucket=settings.s3_bucket_name,
-                        Delete={"Objects": objects},
-                    )
-                    deleted += len(objects)
-
-        logger.info("chapter_images_deleted", series_id=series_id, chapter_id=chapter_id, count=deleted)
+        deleted = len(paths) - failed
+        logger.info("images_deleted", count=deleted, failed=failed)
         return deleted
 
     async def ensure_bucket_exists(self) -> None:
         """Create bucket if it doesn't exist."""
-        async with self.session.client(**self._get_s3_config()) as s3:
-            try:
-                await s3.head_bucket(Bucket=settings.s3_bucket_name)
-            except Exception:
-                await s3.create_bucket(
+        s3 = await self._get_s3()
+        try:
+            await s3.head_bucket(Bucket=settings.s3_bucket_name)
+        except Exception:
+            await s3.create_bucket(
+                Bucket=settings.s3_bucket_name,
+                CreateBucketConfiguration={
+                    "LocationConstraint": settings.s3_region,
+                } if settings.s3_region != "us-east-1" else {},
+            )
+            logger.info("bucket_created", bucket=settings.s3_bucket_name)
+
+            # Set bucket policy for public read (MinIO)
+            if settings.s3_endpoint_url:
+                policy = {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {"AWS": "*"},
+                            "Action": ["s3:GetObject"],
+                            "Resource": [f"arn:aws:s3:::{settings.s3_bucket_name}/*"],
+                        }
+                    ],
+                }
+                import json
+                await s3.put_bucket_policy(
                     Bucket=settings.s3_bucket_name,
-                    CreateBucketConfiguration={
-                        "LocationConstraint": settings.s3_region,
-                    } if settings.s3_region != "us-east-1" else {},
+                    Policy=json.dumps(policy),
                 )
-                logger.info("bucket_created", bucket=settings.s3_bucket_name)
-
-                # Set bucket policy for public read (MinIO)
-                if settings.s3_endpoint_url:
-                    policy = {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Principal": {"AWS": "*"},
-                                "Action": ["s3:GetObject"],
-                                "Resource": [f"arn:aws:s3:::{settings.s3_bucket_name}/*"],
-                            }
-                        ],
-                    }
-                    import json
-                    await s3.put_bucket_policy(
-                        Bucket=settings.s3_bucket_name,
-                        Policy=json.dumps(policy),
-                    )
+
+
+# aiobotocore and httpx connections belong to the loop that opened them, so
+# the shared storage is kept per event loop, like scrapers.http.
+_storages: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ImageStorage]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_storage() -> ImageStorage:
+    """Get the image storage shared on the running loop."""
+    loop = asyncio.get_running_loop()
+    storage = _storages.get(loop)
+    if storage is None:
+        storage = _storages[loop] = ImageStorage()
+    return storage
+
+
+async def close_storage() -> None:
+    """Close the running loop's shared storage. Call before the loop closes."""
+    storage = _storages.pop(asyncio.get_running_loop(), None)
+    if storage is not None:
+        await storage.close()
@@ -38,6 +38,7 @@ celery_app.conf.update(
         "manga_scraper.workers.tasks.scrape_chapter": {"queue": "scraper"},
         "manga_scraper.workers.tasks.scrape_chapter_browser": {"queue": "browser"},
         "manga_scraper.workers.tasks.download_images": {"queue": "downloader"},
+        "manga_scraper.workers.tasks.delete_stored_images": {"queue": "downloader"},
         "manga_scraper.workers.tasks.check_series_updates": {"queue": "scheduler"},
     },
     
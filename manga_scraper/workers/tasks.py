@@ -1,28 +1,142 @@
 import asyncio
+import threading
 import traceback
+from collections.abc import Coroutine, Iterable
 from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar, cast
 
-from celery import shared_task
-from sqlalchemy import select, and_
+from celery import Task, shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import delete, func, select, and_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Session
 
+from manga_scraper.config import settings
 from manga_scraper.core.database import get_sync_db
 from manga_scraper.core.logging import get_logger
-from manga_scraper.models import Job, JobStatus, JobType, Series, Chapter
-from manga_scraper.scrapers import get_scraper_for_url
-from manga_scraper.storage import ImageStorage
+from manga_scraper.core.redis import get_redis
+from manga_scraper.models import Base, Job, JobStatus, JobType, Series, Chapter
+from manga_scraper.scrapers import BaseScraper, get_scraper_for_url
+from manga_scraper.scrapers.browser_pool import close_browser_pool
+from manga_scraper.scrapers.http import close_shared_client
+from manga_scraper.storage import ImageStorage, close_storage, get_storage
 
 logger = get_logger("tasks")
 
+T = TypeVar("T")
+
+# One event loop per worker thread, kept for the life of the process so the
+# loop-bound browser pool, HTTP/S3 clients and Redis connections carry over
+# from task to task instead of being rebuilt each time.
+_worker = threading.local()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_worker, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _worker.loop = asyncio.new_event_loop()
+    return loop
+
+
+def _init_worker_loop(**kwargs: Any) -> None:
+    """Start each forked worker with its own loop, not one copied from the parent."""
+    _worker.loop = asyncio.new_event_loop()
+
+
+def _close_worker_loop(**kwargs: Any) -> None:
+    """Close the loop's shared resources, then the loop itself."""
+    loop = getattr(_worker, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+
+    async def _close_resources() -> None:
+        await close_browser_pool()
+        await close_shared_client()
+        await close_storage()
+        await get_redis().close()
 
-def run_async(coro):
-    """Run async function in sync context."""
-    loop = asyncio.new_event_loop()
     try:
-        return loop.run_until_complete(coro)
+        loop.run_until_complete(_close_resources())
+    except Exception as e:
+        logger.warning("worker_loop_close_failed", error=str(e))
     finally:
         loop.close()
 
 
+# Connected by call rather than as decorators, which celery leaves untyped
+worker_process_init.connect(_init_worker_loop)
+worker_process_shutdown.connect(_close_worker_loop)
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run async function in sync context, on this worker's persistent loop."""
+    return _get_worker_loop().run_until_complete(coro)
+
+
+def run_scraper(scraper: BaseScraper, coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a scraper coroutine, then close the scraper on the same loop.
+
+    The loop's browser pool and HTTP client stay open for the next task;
+    _close_worker_loop closes them when the worker process exits.
+    """
+    async def _run() -> T:
+        try:
+            return await coro
+        finally:
+            await scraper.close()
+
+    return run_async(_run())
+
+
+def insert_new_rows(
+    db: Session,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    conflict_columns: list[str],
+) -> int:
+    """
+    Insert rows, letting Postgres skip any that already exist on the
+    conflict_columns unique key. Returns the number of rows inserted.
+    """
+    inserted = 0
+    # Chunked to stay well under Postgres' 65535 bind parameters per statement
+    for start in range(0, len(rows), 1000):
+        stmt = (
+            insert(model)
+            .values(rows[start:start + 1000])
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(model.id)
+        )
+        inserted += len(db.execute(stmt).all())
+    return inserted
+
+
+def bulk_delay(task: Task, args_list: Iterable[tuple[Any, ...]]) -> int:
+    """
+    Queue many calls of one task over a single broker producer.
+
+    The Redis transport still pushes one message per call, but the
+    connection and channel are checked out once instead of per .delay().
+    Returns the number of tasks queued.
+    """
+    count = 0
+    with task.app.producer_or_acquire() as producer:
+        for args in args_list:
+            task.apply_async(args, producer=producer)
+            count += 1
+    return count
+
+
+def invalidate_cache(*keys: str) -> None:
+    """Drop API cache entries for rows a task has just written."""
+    try:
+        get_redis().delete_cached_sync(*keys)
+    except Exception as e:
+        logger.warning("cache_invalidate_failed", keys=keys, error=str(e))
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def scrape_series(self, series_url: str, job_id: int | None = None):
     """
@@ -50,7 +164,7 @@ def scrape_series(self, series_url: str, job_id: int | None = None):
             raise ValueError(f"No scraper available for URL: {series_url}")
 
         # Run scraper
-        series_data = run_async(scraper.scrape_series(series_url))
+        series_data = run_scraper(scraper, scraper.scrape_series(series_url))
 
         # Save to database
         series = db.execute(
@@ -71,29 +185,26 @@ def scrape_series(self, series_url: str, job_id: int | None = None):
                 if key != "chapters" and value is not None:
                     setattr(series, key, value)
 
-        # Save chapters
-        chapters_added = 0
-        for ch_data in series_data.get("chapters", []):
-            existing = db.execute(
-                select(Chapter).where(
-                    and_(
-                        Chapter.series_id == series.id,
-                        Chapter.chapter_number == ch_data["chapter_number"],
-                    )
-                )
-            ).scalar_one_or_none()
-
-            if existing is None:
-                chapter = Chapter(series_id=series.id, **ch_data)
-                db.add(chapter)
-                chapters_added += 1
+        # Save chapters; existing (series_id, chapter_number) rows are skipped
+        chapters_added = insert_new_rows(
+            db,
+            Chapter,
+            [{"series_id": series.id, **ch_data} for ch_data in series_data.get("chapters", [])],
+            ["series_id", "chapter_number"],
+        )
 
+        # Count what is stored, so chapters missing from this scrape still count
+        total, latest = db.execute(
+            select(func.count(Chapter.id), func.max(Chapter.chapter_number))
+            .where(Chapter.series_id == series.id)
+        ).one()
         series.last_checked_at = datetime.now(timezone.utc)
-        series.total_chapters = len(series_data.get("chapters", []))
-        if series_data.get("chapters"):
-            series.latest_chapter = max(c["chapter_number"] for c in series_data["chapters"])
+        series.total_chapters = total
+        if latest is not None:
+            series.latest_chapter = latest
 
         db.commit()
+        invalidate_cache(f"series:{series.id}")
 
         # Update job
         if job:
@@ -158,29 +269,23 @@ def scrape_chapter(self, chapter_id: int, job_id: int | None = None):
             raise ValueError(f"No scraper for URL: {chapter.source_url}")
 
         # Scrape images
-        images_data = run_async(scraper.scrape_chapter(chapter.source_url))
+        images_data = run_scraper(scraper, scraper.scrape_chapter(chapter.source_url))
 
         # Save images and queue downloads
         from manga_scraper.models import ChapterImage
 
-        for img_data in images_data:
-            existing = db.execute(
-                select(ChapterImage).where(
-                    and_(
-                        ChapterImage.chapter_id == chapter_id,
-                        ChapterImage.page_number == img_data["page_number"],
-                    )
-                )
-            ).scalar_one_or_none()
-
-            if existing is None:
-                image = ChapterImage(chapter_id=chapter_id, **img_data)
-                db.add(image)
+        insert_new_rows(
+            db,
+            ChapterImage,
+            [{"chapter_id": chapter_id, **img_data} for img_data in images_data],
+            ["chapter_id", "page_number"],
+        )
 
         chapter.is_scraped = True
         chapter.scraped_at = datetime.now(timezone.utc)
         chapter.total_images = len(images_data)
         db.commit()
+        invalidate_cache(f"chapter:{chapter_id}")
 
         # Queue image downloads
         download_images.delay(chapter_id)
@@ -230,28 +335,24 @@ def scrape_chapter_browser(self, chapter_id: int, job_id: int | None = None):
             raise ValueError(f"No scraper for URL: {chapter.source_url}")
 
         # Force browser mode
-        images_data = run_async(scraper.scrape_chapter(chapter.source_url, force_browser=True))
+        images_data = run_scraper(
+            scraper, scraper.scrape_chapter(chapter.source_url, force_browser=True)
+        )
 
         from manga_scraper.models import ChapterImage
 
-        for img_data in images_data:
-            existing = db.execute(
-                select(ChapterImage).where(
-                    and_(
-                        ChapterImage.chapter_id == chapter_id,
-                        ChapterImage.page_number == img_data["page_number"],
-                    )
-                )
-            ).scalar_one_or_none()
-
-            if existing is None:
-                image = ChapterImage(chapter_id=chapter_id, **img_data)
-                db.add(image)
+        insert_new_rows(
+            db,
+            ChapterImage,
+            [{"chapter_id": chapter_id, **img_data} for img_data in images_data],
+            ["chapter_id", "page_number"],
+        )
 
         chapter.is_scraped = True
         chapter.scraped_at = datetime.now(timezone.utc)
         chapter.total_images = len(images_data)
         db.commit()
+        invalidate_cache(f"chapter:{chapter_id}")
 
         download_images.delay(chapter_id)
 
@@ -295,20 +396,31 @@ def download_images(self, chapter_id: int):
 
         logger.info("downloading_images", chapter_id=chapter_id, count=len(images))
 
-        storage = ImageStorage()
-        downloaded = 0
+        # Downloads are pure I/O: run them side by side on one loop, capped
+        semaphore = asyncio.Semaphore(settings.s3_download_concurrency)
 
-        for image in images:
-            try:
-                result = run_async(
-                    storage.download_and_store(
+        async def _download(
+            storage: ImageStorage, image: ChapterImage
+        ) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    return await storage.download_and_store(
                         source_url=image.source_url,
                         series_id=chapter.series_id,
                         chapter_id=chapter_id,
                         page_number=image.page_number,
                     )
-                )
+                except Exception as e:
+                    logger.warning("image_download_failed", image_id=image.id, error=str(e))
+                    return None
+
+        async def _run() -> list[dict[str, Any] | None]:
+            storage = get_storage()
+            return await asyncio.gather(*(_download(storage, image) for image in images))
 
+        downloaded = 0
+        for image, result in zip(images, run_async(_run())):
+            if result is not None:
                 image.storage_path = result["path"]
                 image.storage_url = result["url"]
                 image.file_size = result.get("size")
@@ -316,10 +428,8 @@ def download_images(self, chapter_id: int):
                 image.is_downloaded = True
                 downloaded += 1
 
-            except Exception as e:
-                logger.warning("image_download_failed", image_id=image.id, error=str(e))
-
         db.commit()
+        invalidate_cache(f"chapter:{chapter_id}")
         logger.info("images_downloaded", chapter_id=chapter_id, downloaded=downloaded)
 
         return {"chapter_id": chapter_id, "downloaded": downloaded}
@@ -333,6 +443,18 @@ def download_images(self, chapter_id: int):
         db.close()
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def delete_stored_images(self, paths: list[str]):
+    """Delete stored image objects whose database rows are already gone."""
+    try:
+        deleted = run_async(get_storage().delete_objects(paths))
+        return {"deleted": deleted}
+
+    except Exception as exc:
+        logger.warning("chapter_images_delete_failed", count=len(paths), error=str(exc))
+        raise self.retry(exc=exc)
+
+
 @shared_task
 def check_all_series_updates():
     """Periodic task to check all active series for new chapters."""
@@ -342,27 +464,38 @@ def check_all_series_updates():
         # Get active series that haven't been checked recently
         cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
         series_list = db.execute(
-            select(Series).where(
+            select(Series.id, Series.source_url).where(
                 and_(
                     Series.is_active == True,
                     (Series.last_checked_at == None) | (Series.last_checked_at < cutoff),
                 )
             )
-        ).scalars().all()
+        ).all()
 
         logger.info("checking_series_updates", count=len(series_list))
 
-        for series in series_list:
-            # Create job and queue scrape
-            job = Job(
-                job_type=JobType.CHECK_UPDATES,
-                series_id=series.id,
-                input_data={"series_url": series.source_url},
-            )
-            db.add(job)
-            db.commit()
+        if not series_list:
+            return {"series_checked": 0}
+
+        # Create all jobs in one INSERT ... RETURNING and one commit
+        job_ids = db.execute(
+            insert(Job).returning(Job.id, sort_by_parameter_order=True),
+            [
+                {
+                    "job_type": JobType.CHECK_UPDATES,
+                    "series_id": series_id,
+                    "input_data": {"series_url": source_url},
+                }
+                for series_id, source_url in series_list
+            ],
+        ).scalars().all()
+        db.commit()
 
-            scrape_series.delay(series.source_url, job.id)
+        # Publish all scrapes over one broker producer
+        bulk_delay(
+            scrape_series,
+            ((source_url, job_id) for (_, source_url), job_id in zip(series_list, job_ids)),
+        )
 
         return {"series_checked": len(series_list)}
 
@@ -377,19 +510,22 @@ def cleanup_old_jobs():
 
     try:
         cutoff = datetime.now(timezone.utc) - timedelta(days=7)
-        result = db.execute(
-            select(Job).where(
-                and_(
-                    Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
-                    Job.completed_at < cutoff,
+        # One server-side DELETE; no rows are loaded into the session
+        # DML results are CursorResults; Session.execute is typed as Result
+        result = cast(
+            CursorResult[Any],
+            db.execute(
+                delete(Job)
+                .where(
+                    and_(
+                        Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+                        Job.completed_at < cutoff,
+                    )
                 )
-            )
+                .execution_options(synchronize_session=False)
+            ),
         )
-        old_jobs = result.scalars().all()
-
-        count = len(old_jobs)
-        for job in old_jobs:
-            db.delete(job)
+        count = result.rowcount
 
         db.commit()
         logger.info("cleaned_old_jobs", count=count)
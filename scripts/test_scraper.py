@@ -2,100 +2,161 @@
 """
 Quick test script to verify scraper works.
 Run after: pip install -e .
+Pass --with-cloudflare to also test the Cloudflare-protected site, and
+--cassettes DIR to replay pages saved by an earlier run instead of
+fetching them again.
 """
+import argparse
 import asyncio
-import sys
+import hashlib
+import traceback
+from pathlib import Path
 
-sys.path.insert(0, ".")
+try:
+    import uvloop
+except ImportError:  # Windows, or installed without uvicorn[standard]
+    uvloop = None
 
+from manga_scraper.scrapers.asura import AsuraScraper
+from manga_scraper.scrapers.browser_pool import close_browser_pool
+from manga_scraper.scrapers.http import close_shared_client
+from manga_scraper.scrapers.mgeko import MgekoScraper
 
-async def test_mgeko():
-    """Test mgeko.cc scraper (no Cloudflare)."""
-    from manga_scraper.scrapers.mgeko import MgekoScraper
+# Chapters of the mgeko series to scrape, and how many at once
+CHAPTERS_TO_TEST = 5
+CHAPTER_CONCURRENCY = 4
 
-    scraper = MgekoScraper()
 
-    print("Testing mgeko.cc scraper...")
-    print("-" * 50)
+def use_cassettes(scraper, directory: Path) -> None:
+    """
+    Serve the scraper's fetch_page from pages saved in directory, fetching
+    and saving any page that isn't there yet. Parsing still runs for real.
+    """
+    live_fetch = scraper.fetch_page
+
+    async def fetch_page(url, force_browser=False, wait_selector=None):
+        digest = hashlib.sha1(url.encode()).hexdigest()[:16]
+        path = directory / f"{scraper.SITE_NAME}-{digest}.html"
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+
+        html = await live_fetch(url, force_browser=force_browser, wait_selector=wait_selector)
+        directory.mkdir(parents=True, exist_ok=True)
+        path.write_text(html, encoding="utf-8")
+        return html
+
+    scraper.fetch_page = fetch_page
+
+
+async def test_mgeko(cassettes: Path | None = None) -> list[str]:
+    """Test mgeko.cc scraper (no Cloudflare). Returns the report lines."""
+    scraper = MgekoScraper()
+    if cassettes:
+        use_cassettes(scraper, cassettes)
+    out = ["Testing mgeko.cc scraper...", "-" * 50]
 
     # Test series scraping
     test_url = "https://www.mgeko.cc/manga/ovcharka/"
-    print(f"Scraping series: {test_url}")
+    out.append(f"Scraping series: {test_url}")
 
     try:
         series_data = await scraper.scrape_series(test_url)
-        print(f"✓ Title: {series_data['title']}")
-        print(f"✓ Status: {series_data['status']}")
-        print(f"✓ Chapters found: {len(series_data['chapters'])}")
-
-        if series_data["chapters"]:
-            # Test chapter scraping
-            first_chapter = series_data["chapters"][0]
-            print(f"\nScraping chapter: {first_chapter['source_url']}")
-
-            images = await scraper.scrape_chapter(first_chapter["source_url"])
-            print(f"✓ Images found: {len(images)}")
-
+        out.append(f"✓ Title: {series_data['title']}")
+        out.append(f"✓ Status: {series_data['status']}")
+        out.append(f"✓ Chapters found: {len(series_data['chapters'])}")
+
+        # Test chapter scraping; the scraper's rate limiter and HTTP retries
+        # still apply, the semaphore just caps requests in flight
+        chapters = series_data["chapters"][:CHAPTERS_TO_TEST]
+        sem = asyncio.Semaphore(CHAPTER_CONCURRENCY)
+
+        async def scrape(chapter: dict) -> list[dict]:
+            async with sem:
+                return await scraper.scrape_chapter(chapter["source_url"])
+
+        results = await asyncio.gather(
+            *(scrape(chapter) for chapter in chapters),
+            return_exceptions=True,
+        )
+        for chapter, images in zip(chapters, results):
+            out.append(f"\nScraping chapter: {chapter['source_url']}")
+            if isinstance(images, BaseException):
+                out.append(f"✗ Error: {images}")
+                continue
+            out.append(f"✓ Images found: {len(images)}")
             if images:
-                print(f"  First image: {images[0]['source_url'][:80]}...")
+                out.append(f"  First image: {images[0]['source_url'][:80]}...")
 
     except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        out.append(f"✗ Error: {e}")
+        out.append(traceback.format_exc())
 
     finally:
         await scraper.close()
 
+    return out
 
-async def test_asura():
-    """Test asuracomic.net scraper (Cloudflare protected)."""
-    from manga_scraper.scrapers.asura import AsuraScraper
 
+async def test_asura(cassettes: Path | None = None) -> list[str]:
+    """Test asuracomic.net scraper (Cloudflare protected). Returns the report lines."""
     scraper = AsuraScraper()
-
-    print("\n" + "=" * 50)
-    print("Testing asuracomic.net scraper (Cloudflare)...")
-    print("-" * 50)
+    if cassettes:
+        use_cassettes(scraper, cassettes)
+    out = ["Testing asuracomic.net scraper (Cloudflare)...", "-" * 50]
 
     test_url = "https://asuracomic.net/series/solo-leveling-7a80569d"
-
-    print(f"Scraping series: {test_url}")
-    print("(This will launch a browser to bypass Cloudflare)")
+    out.append(f"Scraping series: {test_url}")
 
     try:
         series_data = await scraper.scrape_series(test_url)
-        print(f"✓ Title: {series_data['title']}")
-        print(f"✓ Status: {series_data['status']}")
-        print(f"✓ Chapters found: {len(series_data['chapters'])}")
+        out.append(f"✓ Title: {series_data['title']}")
+        out.append(f"✓ Status: {series_data['status']}")
+        out.append(f"✓ Chapters found: {len(series_data['chapters'])}")
 
     except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        out.append(f"✗ Error: {e}")
+        out.append(traceback.format_exc())
 
     finally:
         await scraper.close()
 
+    return out
 
-async def main():
+
+async def main(with_cloudflare: bool = False, cassettes: Path | None = None):
     print("=" * 50)
     print("Manga Scraper Test Suite")
     print("=" * 50)
 
-    # Test non-CF site first
-    await test_mgeko()
+    tests = [test_mgeko(cassettes)]
+    if with_cloudflare:
+        print("(This will launch a browser to bypass Cloudflare)")
+        tests.append(test_asura(cassettes))
 
-    # Optionally test CF-protected site
-    response = input("\nTest Cloudflare-protected site? (y/n): ")
-    if response.lower() == "y":
-        await test_asura()
+    reports = await asyncio.gather(*tests)
+    for report in reports:
+        print("\n" + "\n".join(report))
 
     print("\n" + "=" * 50)
     print("Tests completed!")
 
+    await close_browser_pool()
+    await close_shared_client()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--with-cloudflare",
+        action="store_true",
+        help="also test asuracomic.net (launches a browser)",
+    )
+    parser.add_argument(
+        "--cassettes",
+        type=Path,
+        metavar="DIR",
+        help="replay pages saved in DIR, recording any that are missing",
+    )
+    args = parser.parse_args()
+    run = uvloop.run if uvloop else asyncio.run
+    run(main(with_cloudflare=args.with_cloudflare, cassettes=args.cassettes))
@@ -1,33 +1,121 @@
+import httpx
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fakeredis import FakeAsyncRedis, FakeServer
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
-from manga_scraper.models import Base
+from manga_scraper.core.database import get_db
+from manga_scraper.core.redis import RedisClient
+from manga_scraper.models import Base, Series
 
 
-@pytest_asyncio.fixture
-async def db_session():
-    """Create in-memory SQLite database for testing."""
+# The models use Postgres ARRAY/JSONB columns; SQLite stores them as JSON so
+# create_all can build the schema. Tests leave those columns unset.
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def engine():
+    """In-memory SQLite database, created once per test run."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        # One shared connection, so every session sees the same :memory: DB
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
-    
+
+    # sqlite3 manages transactions itself and won't SAVEPOINT inside one it
+    # didn't start; let SQLAlchemy emit BEGIN so per-test rollbacks work
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Sorts and temp indexes stay in RAM too; journal/sync pragmas are
+        # no-ops for a :memory: database
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    async_session = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    
-    async with async_session() as session:
-        yield session
-    
+
+    yield engine
+
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(engine):
+    """Session inside a transaction that is rolled back after the test."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        async_session = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            # Commits in the test only release a savepoint
+            join_transaction_mode="create_savepoint",
+        )
+
+        async with async_session() as session:
+            yield session
+
+        await trans.rollback()
+
+
+@pytest.fixture
+def make_series():
+    """Build an unsaved Series; n keeps the unique columns apart."""
+
+    def make(n: int, **fields):
+        defaults = {
+            "slug": f"series-{n}",
+            "source_site": "mgeko",
+            "source_id": str(n),
+            "source_url": f"https://www.mgeko.cc/manga/series-{n}/",
+            "title": f"Series {n}",
+        }
+        return Series(**(defaults | fields))
+
+    return make
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def api_client(db_session, redis):
+    """HTTP client for the app, on the test session and fakeredis."""
+    from manga_scraper.api.app import create_app
+
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: db_session
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis(monkeypatch):
+    """RedisClient on a fresh in-memory fakeredis server, returned by get_redis()."""
+    fake = FakeAsyncRedis(server=FakeServer())
+    client = RedisClient()
+    client._async_client = fake
+    monkeypatch.setattr("manga_scraper.core.redis._redis_client", client)
+
+    yield client
+
+    await fake.aclose()
+
+
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
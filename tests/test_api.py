@@ -0,0 +1,87 @@
+from manga_scraper.models import Series
+
+
+async def add_series(db_session, series):
+    db_session.add(series)
+    await db_session.flush()
+    return series.id
+
+
+async def test_get_series_cached_by_id(api_client, db_session, redis, make_series):
+    """Test the cache key skips the session, and a hit is served as stored."""
+    series_id = await add_series(db_session, make_series(1))
+
+    response = await api_client.get(f"/api/v1/series/{series_id}")
+    assert response.status_code == 200
+    assert await redis.get_cached(f"series:{series_id}") == response.json()
+
+    # Gone from the database, still served from the cache
+    await db_session.delete(await db_session.get(Series, series_id))
+    await db_session.flush()
+    cached = await api_client.get(f"/api/v1/series/{series_id}")
+    assert cached.status_code == 200
+    assert cached.json() == response.json()
+
+
+async def test_get_series_cache_errors_fall_through(
+    api_client, db_session, redis, make_series, monkeypatch
+):
+    """Test a failing Redis is skipped and the endpoint still answers."""
+    series_id = await add_series(db_session, make_series(1))
+
+    async def fail(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(redis, "get_cached", fail)
+    monkeypatch.setattr(redis, "set_cached", fail)
+
+    response = await api_client.get(f"/api/v1/series/{series_id}")
+    assert response.status_code == 200
+    assert response.json()["slug"] == "series-1"
+
+
+async def test_delete_series_invalidates_its_chapters(
+    api_client, db_session, redis, make_series
+):
+    """Test delete_series drops the series entry and every chapter entry."""
+    series_id = await add_series(db_session, make_series(1))
+    for key in (f"series:{series_id}", "chapter:1", "chapter:2", "job-stats"):
+        await redis.set_cached(key, {"cached": True})
+
+    response = await api_client.delete(f"/api/v1/series/{series_id}")
+    assert response.status_code == 200
+
+    assert await redis.get_cached(f"series:{series_id}") is None
+    assert await redis.get_cached("chapter:1") is None
+    assert await redis.get_cached("chapter:2") is None
+    assert await redis.get_cached("job-stats") == {"cached": True}
+
+
+async def test_toggle_active_invalidates_series(api_client, db_session, redis, make_series):
+    """Test toggling is_active drops the cached series, so the change shows."""
+    series_id = await add_series(db_session, make_series(1))
+    assert (await api_client.get(f"/api/v1/series/{series_id}")).json()["is_active"] is True
+
+    response = await api_client.patch(f"/api/v1/series/{series_id}/toggle-active")
+    assert response.json() == {"id": series_id, "is_active": False}
+
+    await db_session.flush()
+    response = await api_client.get(f"/api/v1/series/{series_id}")
+    assert response.json()["is_active"] is False
+
+
+async def test_list_series_page_past_end_keeps_total(api_client, db_session, make_series):
+    """Test a page past the end has no items but still reports the filtered total."""
+    for n in range(1, 4):
+        await add_series(db_session, make_series(n))
+    await add_series(db_session, make_series(4, source_site="asura"))
+
+    response = await api_client.get("/api/v1/series/?source_site=mgeko&page=2&per_page=2")
+    body = response.json()
+    assert len(body["items"]) == 1
+    assert (body["total"], body["pages"]) == (3, 2)
+
+    response = await api_client.get("/api/v1/series/?source_site=mgeko&page=5&per_page=2")
+    body = response.json()
+    assert body["items"] == []
+    assert (body["total"], body["pages"]) == (3, 2)
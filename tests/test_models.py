@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import func, select
+
+from manga_scraper.models import Series, SeriesStatus
+
+
+@pytest.mark.parametrize("run", [1, 2])
+async def test_db_session_rolls_back_between_tests(db_session, make_series, run):
+    """Test that rows committed in one test are gone in the next."""
+    assert await db_session.scalar(select(func.count()).select_from(Series)) == 0
+
+    db_session.add(make_series(run))
+    await db_session.commit()
+    assert await db_session.scalar(select(func.count()).select_from(Series)) == 1
+
+
+async def test_to_dict(db_session, make_series):
+    """Test to_dict returns every column, server defaults included."""
+    series = make_series(1)
+    db_session.add(series)
+    await db_session.flush()
+    await db_session.refresh(series)
+
+    data = series.to_dict()
+    assert set(data) == {column.name for column in Series.__table__.columns}
+    assert data["slug"] == "series-1"
+    assert data["status"] is SeriesStatus.UNKNOWN
+    assert data["id"] is not None
+    assert data["created_at"] is not None
@@ -0,0 +1,36 @@
+import asyncio
+
+
+async def test_rate_limit_token_bucket(redis):
+    """Test the bucket drains at the limit, then refills limit per window."""
+    key = "rate_bucket:test"
+    taken = [await redis.take_rate_limit_token(key, 10, window=1) for _ in range(10)]
+    assert [wait for wait, _ in taken] == [0] * 10
+    assert taken[0][1] == 9
+    assert taken[-1][1] == 0
+
+    # 10 tokens per second: the next one is at most 100 ms away
+    wait, remaining = await redis.take_rate_limit_token(key, 10, window=1)
+    assert 0 < wait <= 100
+    assert remaining == 0
+
+    await asyncio.sleep(wait / 1000 + 0.02)
+    wait, _ = await redis.take_rate_limit_token(key, 10, window=1)
+    assert wait == 0
+
+
+async def test_release_lock_keeps_another_holders_lock(redis):
+    """Test a stale token can't release a lock that has since changed hands."""
+    token = await redis.acquire_lock("sync", timeout=30)
+    assert token is not None
+    assert await redis.acquire_lock("sync") is None
+
+    # The first holder's lock expires and another worker takes it
+    await redis.get_async_client().delete("lock:sync")
+    other = await redis.acquire_lock("sync")
+    assert other is not None
+
+    assert await redis.release_lock("sync", token) is False
+    assert await redis.get_async_client().get("lock:sync") == other.encode()
+    assert await redis.release_lock("sync", other) is True
+    assert await redis.acquire_lock("sync") is not None
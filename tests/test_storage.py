@@ -0,0 +1,75 @@
+import hashlib
+from io import BytesIO
+
+import httpx
+import pytest
+from PIL import Image
+
+from manga_scraper.storage.s3 import ImageStorage
+
+
+class FakeS3:
+    """Records the S3 calls download_and_store makes; nothing is stored yet."""
+
+    def __init__(self):
+        self.puts = []
+        self.copies = []
+
+    async def head_object(self, **kwargs):
+        raise Exception("404")
+
+    async def put_object(self, **kwargs):
+        self.puts.append((kwargs["Key"], kwargs["ContentType"]))
+
+    async def copy_object(self, **kwargs):
+        self.copies.append((kwargs["CopySource"]["Key"], kwargs["Key"]))
+
+
+@pytest.fixture
+def storage(redis):
+    storage = ImageStorage()
+    storage._s3 = FakeS3()
+    return storage
+
+
+def serve(storage, monkeypatch, content, content_type="image/png"):
+    async def download(source_url):
+        return httpx.Response(200, content=content, headers={"content-type": content_type})
+
+    monkeypatch.setattr(storage, "_download", download)
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8), (200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def test_repeated_image_is_copied(storage, monkeypatch):
+    """Test a page seen before is copied server-side instead of re-uploaded."""
+    serve(storage, monkeypatch, png_bytes())
+
+    first = await storage.download_and_store("https://x/credits.png", 1, 10, 1)
+    second = await storage.download_and_store("https://x/credits.png", 1, 11, 1)
+
+    assert storage._s3.puts == [(first["path"], "image/webp")]
+    assert storage._s3.copies == [(first["path"], second["path"])]
+    assert second["path"] == "series/1/chapters/11/0001.webp"
+    assert second["size"] == first["size"]
+
+
+async def test_unencodable_image_is_indexed_raw(storage, redis, monkeypatch):
+    """Test raw bytes stored after a failed encode aren't indexed as WebP."""
+    content = b"not an image"
+    serve(storage, monkeypatch, content, content_type="image/jpeg")
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    result = await storage.download_and_store("https://x/broken.jpg", 1, 10, 1)
+    assert result["content_type"] == "image/jpeg"
+    assert await redis.get_cached(f"image_hash:{digest}:webp") is None
+    assert await redis.get_cached(f"image_hash:{digest}:raw") == result
+
+    # The same bytes on another page are uploaded again, not copied as WebP
+    await storage.download_and_store("https://x/broken.jpg", 1, 11, 1)
+    assert storage._s3.copies == []
+    assert len(storage._s3.puts) == 2